@@ -76,19 +76,21 @@ def setup_logger(name: str, level: int | None = None) -> logging.Logger:
     return logger
 
 
-def set_global_log_level(level: int) -> None:
+def set_global_log_level(level: int, root: logging.Logger | None = None) -> None:
     """Set the global log level for all loggers in the application.
 
     Parameters
     ----------
     level : int
         The logging level to set (e.g., logging.DEBUG, logging.INFO, logging.WARNING)
+    root : logging.Logger, optional
+        The root logger whose manager holds the loggers to update. If None, uses the process root logger.
     """
     # Get the root logger and set its level
-    root_logger = logging.getLogger()
+    root_logger = root if root is not None else logging.getLogger()
     root_logger.setLevel(level)
 
     # Also set the level for all existing loggers
-    for logger_name in logging.root.manager.loggerDict:
-        logger = logging.getLogger(logger_name)
+    for logger_name in root_logger.manager.loggerDict:
+        logger = root_logger.manager.getLogger(logger_name)
         logger.setLevel(level)
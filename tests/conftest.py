@@ -4,9 +4,10 @@ import matplotlib as mpl
 
 mpl.use("Agg")  # Use non-interactive backend to suppress window creation
 
+import csv
+import logging
 import pathlib
-from datetime import datetime
-from zoneinfo import ZoneInfo
+from collections.abc import Callable, Iterator
 
 import pandas as pd
 import pytest
@@ -23,15 +24,8 @@ def relative_precision() -> float:
     return 1e-12
 
 
-@pytest.fixture
-def fake_boot_timestamp() -> float:
-    """Fixture to provide a fake boot timestamp."""
-    return datetime(2025, 4, 25, 6, 30, 0, tzinfo=ZoneInfo("Europe/Berlin")).timestamp()
-
-
-@pytest.fixture
-def line() -> tr.TimeRecorder:
-    """Fixture to create a sample TimeRecorder for calculate_overtime tests."""
+def _sample_time_recorder(**overrides: str | int | bool) -> tr.TimeRecorder:
+    """Build the sample TimeRecorder: 24.04.2025, 08:00-16:00, no lunch break, with any config keys overridden."""
     return tr.TimeRecorder(
         {
             "date": "24.04.2025",
@@ -42,31 +36,126 @@ def line() -> tr.TimeRecorder:
             "timezone": "Europe/Berlin",
             "full_format": "%d.%m.%Y %H:%M:%S",
             "standard_work_hours": 8,
+            **overrides,
         },
     )
 
 
+@pytest.fixture
+def line() -> tr.TimeRecorder:
+    """Fixture to create a sample TimeRecorder for tests that modify it."""
+    return _sample_time_recorder()
+
+
+@pytest.fixture(scope="session")
+def line_readonly() -> tr.TimeRecorder:
+    """Fixture to share one sample TimeRecorder across the session for tests that never modify it."""
+    return _sample_time_recorder()
+
+
+@pytest.fixture(scope="session")
+def time_recorder_factory() -> Callable[..., tr.TimeRecorder]:
+    """Fixture to build sample TimeRecorders from config overrides, sharing one instance per distinct override set.
+
+    The returned instances are shared across the session; copy them before modifying.
+    """
+    cache: dict[tuple, tr.TimeRecorder] = {}
+
+    def _make(**overrides: str | int | bool) -> tr.TimeRecorder:
+        key = tuple(sorted(overrides.items()))
+        if key not in cache:
+            cache[key] = _sample_time_recorder(**overrides)
+        return cache[key]
+
+    return _make
+
+
+def _logbook_data(log_file: pathlib.Path) -> dict:
+    """Return the Logbook configuration shared by the logbook fixtures."""
+    return {
+        "log_path": log_file,
+        "full_format": "%d.%m.%Y %H:%M:%S",
+        "holidays": "DE",
+        "subdivision": "HE",
+        "standard_work_hours": 8,
+        "work_days": [0, 1, 2, 3, 4],
+    }
+
+
 @pytest.fixture
 def logbook(tmp_path: pathlib.Path) -> lb.Logbook:
     """Fixture to create a sample Logbook for testing with isolated temporary file."""
     # Use pytest's tmp_path fixture for automatic test isolation and cleanup
-    log_file = tmp_path / "log.csv"
+    return lb.Logbook(data=_logbook_data(tmp_path / "log.csv"))
 
-    return lb.Logbook(
-        data={
-            "log_path": log_file,
-            "full_format": "%d.%m.%Y %H:%M:%S",
-            "holidays": "DE",
-            "subdivision": "HE",
-            "standard_work_hours": 8,
-            "work_days": [0, 1, 2, 3, 4],
-        },
-    )
+
+@pytest.fixture(scope="module")
+def module_logbook(tmp_path_factory: pytest.TempPathFactory) -> lb.Logbook:
+    """Fixture to share one Logbook across a test module whose tests each write the logbook file before using it."""
+    return lb.Logbook(data=_logbook_data(tmp_path_factory.mktemp("module_logbook") / "log.csv"))
+
+
+@pytest.fixture(scope="session")
+def logbook_readonly(tmp_path_factory: pytest.TempPathFactory) -> lb.Logbook:
+    """Fixture to create one Logbook per session for tests that never read or write the logbook file."""
+    return lb.Logbook(data=_logbook_data(tmp_path_factory.mktemp("logbook_readonly") / "log.csv"))
+
+
+@pytest.fixture
+def in_memory_logbook(logbook: lb.Logbook, monkeypatch: pytest.MonkeyPatch) -> lb.Logbook:
+    """Fixture to create a Logbook whose save/load round-trip stays in memory instead of going through the file."""
+    store: dict[str, pd.DataFrame] = {}
+
+    def save_logbook(df: pd.DataFrame) -> None:
+        store["df"] = df.copy()
+
+    def load_logbook() -> pd.DataFrame:
+        return store["df"].copy()
+
+    monkeypatch.setattr(logbook, "save_logbook", save_logbook)
+    monkeypatch.setattr(logbook, "load_logbook", load_logbook)
+    return logbook
 
 
 @pytest.fixture
+def write_csv() -> Callable[[pathlib.Path, list[str], list[list]], None]:
+    """Fixture to provide a helper that writes a small semicolon-separated CSV file without going through pandas."""
+
+    def _write_csv(path: pathlib.Path, header: list[str], rows: list[list]) -> None:
+        with path.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f, delimiter=";", lineterminator="\n")
+            writer.writerow(header)
+            writer.writerows(rows)
+
+    return _write_csv
+
+
+@pytest.fixture(scope="session")
+def load_logbook_fast() -> Callable[[pathlib.Path], pd.DataFrame]:
+    """Fixture to provide a CSV logbook reader with declared dtypes for tests that only assert content, not production parsing."""
+    dtypes = {
+        "weekday": "string",
+        "date": "string",
+        "start_time": "string",
+        "end_time": "string",
+        "lunch_break_duration": "int32",
+        "work_time": "float64",
+        "case": "string",
+        "overtime": "float64",
+    }
+
+    def _load_logbook_fast(path: pathlib.Path) -> pd.DataFrame:
+        return pd.read_csv(path, sep=";", encoding="utf-8", dtype=dtypes)
+
+    return _load_logbook_fast
+
+
+@pytest.fixture(scope="module")
 def sample_df() -> pd.DataFrame:
-    """Fixture to create a sample DataFrame with multiple entries for the same date."""
+    """Fixture to create a sample DataFrame with multiple entries for the same date.
+
+    Shared per module, so consumers must not modify it in place; pass a copy to ``Logbook.save_logbook``.
+    """
     return pd.DataFrame(
         {
             "weekday": ["Mon", "Mon", "Mon", "Tue", "Tue"],
@@ -81,9 +170,12 @@ def sample_df() -> pd.DataFrame:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_logbook_df() -> pd.DataFrame:
-    """Sample logbook data for testing."""
+    """Sample logbook data for testing.
+
+    Shared per module, so consumers must not modify it in place; pass a copy to ``Logbook.save_logbook``.
+    """
     return pd.DataFrame(
         {
             "weekday": ["Mon", "Tue", "Wed", "Thu", "Fri"],
@@ -98,6 +190,21 @@ def sample_logbook_df() -> pd.DataFrame:
     )
 
 
+@pytest.fixture(scope="session")
+def year_2024_df() -> pd.DataFrame:
+    """Fixture to provide one logbook row per day of 2024 for the Visualizer filtering tests; do not modify it in place."""
+    dates = pd.date_range(start="2024-01-01", end="2024-12-31", freq="D")
+    return pd.DataFrame(
+        {
+            "weekday": dates.strftime("%a"),
+            "date": dates.strftime("%d.%m.%Y"),
+            "start_time": "08:00:00",
+            "work_time": 8.0,
+            "overtime": 0.0,
+        },
+    )
+
+
 @pytest.fixture
 def sample_config() -> dict:
     """Sample configuration dictionary for testing."""
@@ -177,3 +284,33 @@ def analyzer_df_with_overtime() -> pd.DataFrame:
             "overtime": [0.5, 0.0, -0.5, 1.0, 0.25, 5.0],  # 5.0 is outlier
         },
     )
+
+
+@pytest.fixture
+def restore_log_levels() -> Iterator[None]:
+    """Fixture to restore the levels of the root logger and all registered loggers after tests that call set_global_log_level."""
+    root_logger = logging.getLogger()
+    root_level = root_logger.level
+    levels = {name: logger.level for name, logger in root_logger.manager.loggerDict.items() if isinstance(logger, logging.Logger)}
+    yield
+    root_logger.setLevel(root_level)
+    for name, level in levels.items():
+        logging.getLogger(name).setLevel(level)
+
+
+@pytest.fixture
+def throwaway_logger(request: pytest.FixtureRequest) -> Iterator[Callable[[str], logging.Logger]]:
+    """Fixture to create loggers named after the current test that are cleared and dropped from the logging manager afterwards."""
+    names: list[str] = []
+
+    def _make(suffix: str) -> logging.Logger:
+        name = f"{request.node.name}_{suffix}"
+        names.append(name)
+        return logging.getLogger(name)
+
+    yield _make
+
+    for name in names:
+        logger = logging.root.manager.loggerDict.pop(name, None)
+        if isinstance(logger, logging.Logger):
+            logger.handlers.clear()
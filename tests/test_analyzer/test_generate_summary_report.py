@@ -8,20 +8,41 @@ import pytest
 from src import analyzer
 
 
+@pytest.fixture(autouse=True)
+def info_logs(caplog: pytest.LogCaptureFixture) -> None:
+    """Capture INFO records from the analyzer logger for every test in this module."""
+    caplog.set_level(logging.INFO, logger="src.analyzer")
+
+
+@pytest.fixture(scope="module")
+def weekly_df() -> pd.DataFrame:
+    """Three work days of logbook data for the summary report tests that do not depend on the exact overtime values."""
+    return pd.DataFrame(
+        {
+            "weekday": ["Mon", "Tue", "Wed"],
+            "date": ["01.01.2024", "02.01.2024", "03.01.2024"],
+            "work_time": [8.0, 8.0, 8.0],
+            "overtime": [0.5, 0.0, -0.5],
+        },
+    )
+
+
 @pytest.mark.fast
+@pytest.mark.integration
 def test_generate_summary_report_runs_without_error(
     analyzer_instance: analyzer.Analyzer,
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Test generate_summary_report runs and logs output."""
-    with caplog.at_level(logging.INFO, logger="src.analyzer"):
-        analyzer_instance.generate_summary_report()
+    analyzer_instance.generate_summary_report()
 
-    assert "Analytics" in caplog.text
-    assert "Standard Hours" in caplog.text or "Average Weekly" in caplog.text
+    text = caplog.text
+    assert "Analytics" in text
+    assert "Standard Hours" in text or "Average Weekly" in text
 
 
 @pytest.mark.fast
+@pytest.mark.integration
 def test_generate_summary_report_with_valid_data(
     analyzer_data: dict,
     caplog: pytest.LogCaptureFixture,
@@ -37,14 +58,15 @@ def test_generate_summary_report_with_valid_data(
     )
     ana = analyzer.Analyzer(analyzer_data, df)
 
-    with caplog.at_level(logging.INFO, logger="src.analyzer"):
-        ana.generate_summary_report()
+    ana.generate_summary_report()
 
-    assert "Mean overtime" in caplog.text
-    assert "Outliers" in caplog.text
+    text = caplog.text
+    assert "Mean overtime" in text
+    assert "Outliers" in text
 
 
 @pytest.mark.fast
+@pytest.mark.integration
 def test_generate_summary_report_with_no_valid_overtime(
     analyzer_data: dict,
     caplog: pytest.LogCaptureFixture,
@@ -60,31 +82,33 @@ def test_generate_summary_report_with_no_valid_overtime(
     )
     ana = analyzer.Analyzer(analyzer_data, df)
 
-    with caplog.at_level(logging.INFO, logger="src.analyzer"):
-        ana.generate_summary_report()
+    ana.generate_summary_report()
 
     assert "No valid data available" in caplog.text
 
 
 @pytest.mark.fast
-def test_generate_summary_report_with_fractional_standard_hours(
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    ("standard_work_hours", "expected"),
+    [
+        (7.5, "37h 30m"),
+        (8.0, "40h"),
+        (8.5, "42h 30m"),
+    ],
+)
+def test_generate_summary_report_standard_hours(
     analyzer_data: dict,
+    weekly_df: pd.DataFrame,
     caplog: pytest.LogCaptureFixture,
+    standard_work_hours: float,
+    expected: str,
 ) -> None:
-    """Test generate_summary_report includes minutes when standard hours are fractional."""
-    analyzer_data["standard_work_hours"] = 8.5
+    """Test generate_summary_report formats weekly standard hours, adding minutes only when fractional."""
+    analyzer_data["standard_work_hours"] = standard_work_hours
     analyzer_data["work_days"] = [0, 1, 2, 3, 4]
-    df = pd.DataFrame(
-        {
-            "weekday": ["Mon", "Tue", "Wed"],
-            "date": ["01.01.2024", "02.01.2024", "03.01.2024"],
-            "work_time": [8.0, 8.0, 8.0],
-            "overtime": [0.5, 0.0, -0.5],
-        },
-    )
-    ana = analyzer.Analyzer(analyzer_data, df)
+    ana = analyzer.Analyzer(analyzer_data, weekly_df)
 
-    with caplog.at_level(logging.INFO, logger="src.analyzer"):
-        ana.generate_summary_report()
+    ana.generate_summary_report()
 
-    assert "42h 30m" in caplog.text
+    assert f"Standard Hours: {expected}" in caplog.text.splitlines()
@@ -1,358 +1,175 @@
 """Tests for the tail method in the Analyzer class."""
 
-from unittest.mock import patch
+import logging
 
 import pandas as pd
 import pytest
 
 from src.analyzer import Analyzer
 
+_WEEKDAYS = frozenset({"Mon", "Tue", "Wed", "Thu", "Fri"})
+_LAST_TWO_WEEKDAYS = frozenset({"Thu", "Fri"})
+_LAST_FOUR_WEEKDAYS = frozenset({"Tue", "Wed", "Thu", "Fri"})
 
-@pytest.mark.fast
-def test_tail_default_parameter(analyzer_data: dict, sample_logbook_df: pd.DataFrame) -> None:
-    """Test tail method with default parameter (n=4)."""
-    analyzer_instance = Analyzer(analyzer_data, sample_logbook_df)
-
-    with patch("src.analyzer.logger") as mock_logger:
-        analyzer_instance.tail()
-        mock_logger.info.assert_called_once()
-
-        logged_output = mock_logger.info.call_args[0][0]
-        # Should contain title, separator, and last 4 rows (default)
-        assert "Recent Entries" in logged_output
-        assert "===============" in logged_output
-        assert "Wed" in logged_output
-        assert "Thu" in logged_output
-        assert "Fri" in logged_output
-        assert "Mon" not in logged_output  # First row should not be in last 4
-
-
-@pytest.mark.fast
-def test_tail_custom_parameter(analyzer_data: dict, sample_logbook_df: pd.DataFrame) -> None:
-    """Test tail method with custom parameter (n=2)."""
-    analyzer_instance = Analyzer(analyzer_data, sample_logbook_df)
-
-    with patch("src.analyzer.logger") as mock_logger:
-        analyzer_instance.tail(n=2)
-        mock_logger.info.assert_called_once()
-
-        logged_output = mock_logger.info.call_args[0][0]
-        # Should contain title, separator, and last 2 rows
-        assert "Recent Entries" in logged_output
-        assert "===============" in logged_output
-        assert "Thu" in logged_output
-        assert "Fri" in logged_output
-        assert "Wed" not in logged_output
+_TABLE_HEADER = ("Recent Entries", "===============")
+_NON_NUMERIC = ("Non-numeric values found in work_time or overtime columns. Please check the logbook file.",)
 
 
-@pytest.mark.fast
-def test_tail_empty_dataframe_raises_value_error(analyzer_data: dict) -> None:
-    """Analyzer initialization should fail with empty DataFrame."""
-    empty_df = pd.DataFrame(
-        columns=["weekday", "date", "start_time", "end_time", "lunch_break_duration", "work_time", "case", "overtime"],
-    )
+def _missing(output: str, expected: tuple[str, ...]) -> list[str]:
+    """Return the expected substrings that do not occur in output, so a failing assert lists all of them."""
+    return [substring for substring in expected if substring not in output]
 
-    with pytest.raises(ValueError, match="logbook_df cannot be empty"):
-        Analyzer(analyzer_data, empty_df)
 
-
-@pytest.mark.fast
-def test_tail_n_larger_than_dataframe(analyzer_data: dict, sample_logbook_df: pd.DataFrame) -> None:
-    """Test tail method when n is larger than DataFrame size."""
-    analyzer_instance = Analyzer(analyzer_data, sample_logbook_df)
-
-    with patch("src.analyzer.logger") as mock_logger:
-        analyzer_instance.tail(n=10)  # n > number of rows (5)
-        mock_logger.info.assert_called_once()
-
-        logged_output = mock_logger.info.call_args[0][0]
-        # Should contain title, separator, and all rows since n > dataframe size
-        assert "Recent Entries" in logged_output
-        assert "===============" in logged_output
-        assert "Mon" in logged_output
-        assert "Tue" in logged_output
-        assert "Wed" in logged_output
-        assert "Thu" in logged_output
-        assert "Fri" in logged_output
-
-
-@pytest.mark.fast
-def test_tail_with_zero_values(analyzer_data: dict) -> None:
-    """Test tail method with zero values in work_time and overtime."""
-    df_with_zeros = pd.DataFrame(
+def _tail_df(
+    work_time: list | pd.api.extensions.ExtensionArray,
+    case: list,
+    overtime: list | pd.api.extensions.ExtensionArray,
+) -> pd.DataFrame:
+    """Build a logbook frame on consecutive days with the given work_time, case and overtime values."""
+    n = len(work_time)
+    return pd.DataFrame(
         {
-            "weekday": ["Mon", "Tue"],
-            "date": ["01.01.2024", "02.01.2024"],
-            "start_time": ["08:00:00", "08:00:00"],
-            "end_time": ["17:00:00", "17:00:00"],
-            "lunch_break_duration": ["1.0", "1.0"],
-            "work_time": [0.0, 0.0],
-            "case": ["undertime", "undertime"],
-            "overtime": [0.0, 0.0],
+            "weekday": ["Mon", "Tue", "Wed"][:n],
+            "date": [f"{day:02d}.01.2024" for day in range(1, n + 1)],
+            "start_time": ["08:00:00"] * n,
+            "end_time": ["17:00:00"] * n,
+            "lunch_break_duration": ["1.0"] * n,
+            "work_time": work_time,
+            "case": case,
+            "overtime": overtime,
         },
     )
-    analyzer_instance = Analyzer(analyzer_data, df_with_zeros)
 
-    with patch("src.analyzer.logger") as mock_logger:
-        analyzer_instance.tail()
-        mock_logger.info.assert_called_once()
 
-        logged_output = mock_logger.info.call_args[0][0]
-        # Should show "0h 0m" for zero values (current bug: shows empty string)
-        assert "Recent Entries" in logged_output
-        assert "===============" in logged_output
+_VALUE_CASES = [
+    pytest.param(_tail_df([0.0, 0.0], ["undertime", "undertime"], [0.0, 0.0]), logging.INFO, _TABLE_HEADER, id="zeros"),
+    pytest.param(_tail_df([7.5, 8.25], ["overtime", "overtime"], [0.5, 1.25]), logging.INFO, _TABLE_HEADER, id="decimal_hours"),
+    pytest.param(_tail_df([-1.5, -2.0], ["undertime", "undertime"], [-1.5, -2.0]), logging.INFO, _TABLE_HEADER, id="negatives"),
+    pytest.param(_tail_df(["7.5", "8.0"], ["overtime", "overtime"], ["0.5", "1.0"]), logging.INFO, _TABLE_HEADER, id="strings"),
+    pytest.param(
+        _tail_df([7.5, "8.0", 0.0], ["overtime", "overtime", "undertime"], ["0.5", 1.0, 0.0]),
+        logging.INFO,
+        _TABLE_HEADER,
+        id="mixed_types",
+    ),
+    pytest.param(_tail_df([999.99, 1000.0], ["overtime", "overtime"], [999.99, 1000.0]), logging.INFO, _TABLE_HEADER, id="very_large"),
+    pytest.param(_tail_df([7.5, float("nan")], ["overtime", "undertime"], [0.5, float("nan")]), logging.ERROR, _NON_NUMERIC, id="nan"),
+    pytest.param(
+        _tail_df(pd.array([7.5, pd.NA], dtype="Float64"), ["overtime", "undertime"], pd.array([0.5, pd.NA], dtype="Float64")),
+        logging.ERROR,
+        _NON_NUMERIC,
+        id="nullable_na",
+    ),
+]
+
+_EMPTY_STRINGS_DF = _tail_df([""], ["undertime"], [""])
+_INVALID_STRINGS_DF = _tail_df(["not-a-number"], ["undertime"], ["oops"])
+
+
+@pytest.fixture(autouse=True)
+def info_logs(caplog: pytest.LogCaptureFixture) -> None:
+    """Capture INFO records from the analyzer logger for every test in this module."""
+    caplog.set_level(logging.INFO, logger="src.analyzer")
 
 
 @pytest.mark.fast
-def test_tail_with_decimal_hours(analyzer_data: dict) -> None:
-    """Test tail method with decimal hours (e.g., 7.5 hours)."""
-    df_with_decimals = pd.DataFrame(
-        {
-            "weekday": ["Mon", "Tue"],
-            "date": ["01.01.2024", "02.01.2024"],
-            "start_time": ["08:00:00", "08:00:00"],
-            "end_time": ["17:00:00", "17:00:00"],
-            "lunch_break_duration": ["1.0", "1.0"],
-            "work_time": [7.5, 8.25],
-            "case": ["overtime", "overtime"],
-            "overtime": [0.5, 1.25],
-        },
-    )
-    analyzer_instance = Analyzer(analyzer_data, df_with_decimals)
-
-    with patch("src.analyzer.logger") as mock_logger:
-        analyzer_instance.tail()
-        mock_logger.info.assert_called_once()
-
-        logged_output = mock_logger.info.call_args[0][0]
-        # Should show formatted hours like "7h 30m" and "8h 15m"
-        assert "Recent Entries" in logged_output
-        assert "===============" in logged_output
-
-
-@pytest.mark.fast
-def test_tail_with_negative_values(analyzer_data: dict) -> None:
-    """Test tail method with negative values in work_time and overtime."""
-    df_with_negatives = pd.DataFrame(
-        {
-            "weekday": ["Mon", "Tue"],
-            "date": ["01.01.2024", "02.01.2024"],
-            "start_time": ["08:00:00", "08:00:00"],
-            "end_time": ["17:00:00", "17:00:00"],
-            "lunch_break_duration": ["1.0", "1.0"],
-            "work_time": [-1.5, -2.0],
-            "case": ["undertime", "undertime"],
-            "overtime": [-1.5, -2.0],
-        },
-    )
-    analyzer_instance = Analyzer(analyzer_data, df_with_negatives)
-
-    with patch("src.analyzer.logger") as mock_logger:
-        analyzer_instance.tail()
-        mock_logger.info.assert_called_once()
+def test_tail_default_parameter(analyzer_instance: Analyzer, caplog: pytest.LogCaptureFixture) -> None:
+    """Test tail method with default parameter (n=4)."""
+    analyzer_instance.tail()
 
-        logged_output = mock_logger.info.call_args[0][0]
-        # Should handle negative values appropriately
-        assert "Recent Entries" in logged_output
-        assert "===============" in logged_output
+    assert [record.levelno for record in caplog.records] == [logging.INFO]
+    logged_output = caplog.records[0].getMessage()
+    # Should contain title, separator, and last 4 rows (default)
+    assert not _missing(logged_output, _TABLE_HEADER)
+    tokens = set(logged_output.split())
+    assert _LAST_FOUR_WEEKDAYS.issubset(tokens)
+    assert (_WEEKDAYS - _LAST_FOUR_WEEKDAYS).isdisjoint(tokens)  # First row should not be in last 4
 
 
 @pytest.mark.fast
-def test_tail_with_string_values(analyzer_data: dict) -> None:
-    """Test tail method with string values in work_time and overtime."""
-    df_with_strings = pd.DataFrame(
-        {
-            "weekday": ["Mon", "Tue"],
-            "date": ["01.01.2024", "02.01.2024"],
-            "start_time": ["08:00:00", "08:00:00"],
-            "end_time": ["17:00:00", "17:00:00"],
-            "lunch_break_duration": ["1.0", "1.0"],
-            "work_time": ["7.5", "8.0"],
-            "case": ["overtime", "overtime"],
-            "overtime": ["0.5", "1.0"],
-        },
-    )
-    analyzer_instance = Analyzer(analyzer_data, df_with_strings)
-
-    with patch("src.analyzer.logger") as mock_logger:
-        analyzer_instance.tail()
-        mock_logger.info.assert_called_once()
+def test_tail_custom_parameter(analyzer_instance: Analyzer, caplog: pytest.LogCaptureFixture) -> None:
+    """Test tail method with custom parameter (n=2)."""
+    analyzer_instance.tail(n=2)
 
-        logged_output = mock_logger.info.call_args[0][0]
-        # Should handle string values appropriately
-        assert "Recent Entries" in logged_output
-        assert "===============" in logged_output
+    assert [record.levelno for record in caplog.records] == [logging.INFO]
+    logged_output = caplog.records[0].getMessage()
+    # Should contain title, separator, and last 2 rows
+    assert not _missing(logged_output, _TABLE_HEADER)
+    tokens = set(logged_output.split())
+    assert _LAST_TWO_WEEKDAYS.issubset(tokens)
+    assert (_WEEKDAYS - _LAST_TWO_WEEKDAYS).isdisjoint(tokens)
 
 
 @pytest.mark.fast
-def test_tail_with_mixed_data_types(analyzer_data: dict) -> None:
-    """Test tail method with mixed data types in work_time and overtime."""
-    df_with_mixed = pd.DataFrame(
-        {
-            "weekday": ["Mon", "Tue", "Wed"],
-            "date": ["01.01.2024", "02.01.2024", "03.01.2024"],
-            "start_time": ["08:00:00", "08:00:00", "08:00:00"],
-            "end_time": ["17:00:00", "17:00:00", "17:00:00"],
-            "lunch_break_duration": ["1.0", "1.0", "1.0"],
-            "work_time": [7.5, "8.0", 0.0],
-            "case": ["overtime", "overtime", "undertime"],
-            "overtime": ["0.5", 1.0, 0.0],
-        },
+def test_tail_empty_dataframe_raises_value_error(analyzer_data: dict) -> None:
+    """Analyzer initialization should fail with empty DataFrame."""
+    empty_df = pd.DataFrame(
+        columns=["weekday", "date", "start_time", "end_time", "lunch_break_duration", "work_time", "case", "overtime"],
     )
-    analyzer_instance = Analyzer(analyzer_data, df_with_mixed)
-
-    with patch("src.analyzer.logger") as mock_logger:
-        analyzer_instance.tail()
-        mock_logger.info.assert_called_once()
 
-        logged_output = mock_logger.info.call_args[0][0]
-        # Should handle mixed data types appropriately
-        assert "Recent Entries" in logged_output
-        assert "===============" in logged_output
+    with pytest.raises(ValueError, match="logbook_df cannot be empty"):
+        Analyzer(analyzer_data, empty_df)
 
 
 @pytest.mark.fast
-def test_tail_with_nan_values(analyzer_data: dict) -> None:
-    """Test tail method with NaN values in work_time and overtime."""
-    df_with_nan = pd.DataFrame(
-        {
-            "weekday": ["Mon", "Tue"],
-            "date": ["01.01.2024", "02.01.2024"],
-            "start_time": ["08:00:00", "08:00:00"],
-            "end_time": ["17:00:00", "17:00:00"],
-            "lunch_break_duration": ["1.0", "1.0"],
-            "work_time": [7.5, float("nan")],
-            "case": ["overtime", "undertime"],
-            "overtime": [0.5, float("nan")],
-        },
-    )
-    analyzer_instance = Analyzer(analyzer_data, df_with_nan)
-
-    with patch("src.analyzer.logger") as mock_logger:
-        analyzer_instance.tail()
-        mock_logger.error.assert_called_once()
+def test_tail_n_larger_than_dataframe(analyzer_instance: Analyzer, caplog: pytest.LogCaptureFixture) -> None:
+    """Test tail method when n is larger than DataFrame size."""
+    analyzer_instance.tail(n=10)  # n > number of rows (5)
 
-        logged_output = mock_logger.error.call_args[0][0]
-        # Should handle NaN values appropriately
-        assert "Non-numeric values found in work_time or overtime columns. Please check the logbook file." in logged_output
+    assert [record.levelno for record in caplog.records] == [logging.INFO]
+    logged_output = caplog.records[0].getMessage()
+    # Should contain title, separator, and all rows since n > dataframe size
+    assert not _missing(logged_output, _TABLE_HEADER)
+    assert _WEEKDAYS.issubset(set(logged_output.split()))
 
 
 @pytest.mark.fast
-def test_tail_with_very_large_values(analyzer_data: dict) -> None:
-    """Test tail method with very large values in work_time and overtime."""
-    df_with_large = pd.DataFrame(
-        {
-            "weekday": ["Mon", "Tue"],
-            "date": ["01.01.2024", "02.01.2024"],
-            "start_time": ["08:00:00", "08:00:00"],
-            "end_time": ["17:00:00", "17:00:00"],
-            "lunch_break_duration": ["1.0", "1.0"],
-            "work_time": [999.99, 1000.0],
-            "case": ["overtime", "overtime"],
-            "overtime": [999.99, 1000.0],
-        },
-    )
-    analyzer_instance = Analyzer(analyzer_data, df_with_large)
+@pytest.mark.parametrize(("df", "level", "expected"), _VALUE_CASES)
+def test_tail_with_value_variants(
+    analyzer_data: dict,
+    caplog: pytest.LogCaptureFixture,
+    df: pd.DataFrame,
+    level: int,
+    expected: tuple[str, ...],
+) -> None:
+    """Test tail method with different kinds of work_time and overtime values."""
+    analyzer_instance = Analyzer(analyzer_data, df)
 
-    with patch("src.analyzer.logger") as mock_logger:
-        analyzer_instance.tail()
-        mock_logger.info.assert_called_once()
+    analyzer_instance.tail()
 
-        logged_output = mock_logger.info.call_args[0][0]
-        # Should handle very large values appropriately
-        assert "Recent Entries" in logged_output
-        assert "===============" in logged_output
+    assert [record.levelno for record in caplog.records] == [level]
+    logged_output = caplog.records[0].getMessage()
+    assert not _missing(logged_output, expected)
 
 
 @pytest.mark.fast
-def test_tail_with_none_values(analyzer_data: dict) -> None:
-    """Test tail method with None values in work_time and overtime."""
-    df_with_none = pd.DataFrame(
-        {
-            "weekday": ["Mon", "Tue"],
-            "date": ["01.01.2024", "02.01.2024"],
-            "start_time": ["08:00:00", "08:00:00"],
-            "end_time": ["17:00:00", "17:00:00"],
-            "lunch_break_duration": ["1.0", "1.0"],
-            "work_time": [7.5, None],
-            "case": ["overtime", "undertime"],
-            "overtime": [0.5, None],
-        },
-    )
-    analyzer_instance = Analyzer(analyzer_data, df_with_none)
+@pytest.mark.parametrize("n", [-1, 0])
+def test_tail_with_invalid_n_parameter(analyzer_instance: Analyzer, caplog: pytest.LogCaptureFixture, n: int) -> None:
+    """Test tail method with invalid n parameter (negative or zero) logs nothing."""
+    analyzer_instance.tail(n=n)
 
-    with patch("src.analyzer.logger") as mock_logger:
-        analyzer_instance.tail()
-        mock_logger.error.assert_called_once()
-
-        logged_output = mock_logger.error.call_args[0][0]
-        # Should handle None values appropriately
-        assert "Non-numeric values found in work_time or overtime columns. Please check the logbook file." in logged_output
+    assert not caplog.records
 
 
 @pytest.mark.fast
-def test_tail_with_invalid_n_parameter(analyzer_data: dict, sample_logbook_df: pd.DataFrame) -> None:
-    """Test tail method with invalid n parameter (negative or zero)."""
-    analyzer_instance = Analyzer(analyzer_data, sample_logbook_df)
-
-    with patch("src.analyzer.logger") as mock_logger:
-        # Test with negative n
-        analyzer_instance.tail(n=-1)
-        mock_logger.info.assert_not_called()
+def test_tail_formats_empty_string_as_blank(analyzer_data: dict, caplog: pytest.LogCaptureFixture) -> None:
+    """tail() keeps empty string values blank in formatted output."""
+    analyzer_instance = Analyzer(analyzer_data, _EMPTY_STRINGS_DF)
 
-        # Reset mock for next test
-        mock_logger.reset_mock()
+    analyzer_instance.tail(n=1)
 
-        # Test with zero n
-        analyzer_instance.tail(n=0)
-        mock_logger.info.assert_not_called()
+    assert [record.levelno for record in caplog.records] == [logging.INFO]
+    logged_output = caplog.records[0].getMessage()
+    assert not _missing(logged_output, ("Recent Entries", "01.01.2024"))
 
 
 @pytest.mark.fast
-def test_tail_formats_empty_string_as_blank(analyzer_data: dict) -> None:
-    """tail() keeps empty string values blank in formatted output."""
-    df_with_empty_strings = pd.DataFrame(
-        {
-            "weekday": ["Mon"],
-            "date": ["01.01.2024"],
-            "start_time": ["08:00:00"],
-            "end_time": ["17:00:00"],
-            "lunch_break_duration": ["1.0"],
-            "work_time": [""],
-            "case": ["undertime"],
-            "overtime": [""],
-        },
-    )
-    analyzer_instance = Analyzer(analyzer_data, df_with_empty_strings)
-
-    with patch("src.analyzer.logger") as mock_logger:
-        analyzer_instance.tail(n=1)
-        mock_logger.info.assert_called_once()
-        logged_output = mock_logger.info.call_args[0][0]
-        assert "Recent Entries" in logged_output
-        assert "01.01.2024" in logged_output
+def test_tail_formats_invalid_string_as_blank(analyzer_data: dict, caplog: pytest.LogCaptureFixture) -> None:
+    """tail() falls back to blank for non-numeric values."""
+    analyzer_instance = Analyzer(analyzer_data, _INVALID_STRINGS_DF)
 
+    analyzer_instance.tail(n=1)
 
-@pytest.mark.fast
-def test_tail_formats_invalid_string_as_blank(analyzer_data: dict) -> None:
-    """tail() falls back to blank for non-numeric values."""
-    df_with_invalid_strings = pd.DataFrame(
-        {
-            "weekday": ["Mon"],
-            "date": ["01.01.2024"],
-            "start_time": ["08:00:00"],
-            "end_time": ["17:00:00"],
-            "lunch_break_duration": ["1.0"],
-            "work_time": ["not-a-number"],
-            "case": ["undertime"],
-            "overtime": ["oops"],
-        },
-    )
-    analyzer_instance = Analyzer(analyzer_data, df_with_invalid_strings)
-
-    with patch("src.analyzer.logger") as mock_logger:
-        analyzer_instance.tail(n=1)
-        mock_logger.info.assert_called_once()
-        logged_output = mock_logger.info.call_args[0][0]
-        assert "Recent Entries" in logged_output
-        assert "01.01.2024" in logged_output
+    assert [record.levelno for record in caplog.records] == [logging.INFO]
+    logged_output = caplog.records[0].getMessage()
+    assert not _missing(logged_output, ("Recent Entries", "01.01.2024"))
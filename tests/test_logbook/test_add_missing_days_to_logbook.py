@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Callable
 from datetime import datetime
 from unittest.mock import patch
 
@@ -7,24 +8,21 @@ import pytest
 
 import src.logbook as lb
 
+_COLUMNS = ["weekday", "date", "start_time", "end_time", "lunch_break_duration", "work_time", "case", "overtime"]
+
 
 @pytest.mark.fast
-def test_add_missing_days_empty_missing_days(logbook: lb.Logbook) -> None:
+def test_add_missing_days_empty_missing_days(logbook: lb.Logbook, write_csv: Callable[..., None]) -> None:
     """Test that add_missing_days_to_logbook handles empty missing_days list."""
     # Create a logbook with some data
-    df = pd.DataFrame(
-        {
-            "weekday": ["Mon", "Wed"],
-            "date": ["01.01.2024", "03.01.2024"],
-            "start_time": ["08:00", "08:00"],
-            "end_time": ["17:00", "17:00"],
-            "lunch_break_duration": ["60", "60"],
-            "work_time": ["8.0", "8.0"],
-            "case": ["overtime", "overtime"],
-            "overtime": ["0.0", "0.0"],
-        },
+    write_csv(
+        logbook.get_path(),
+        _COLUMNS,
+        [
+            ["Mon", "01.01.2024", "08:00", "17:00", "60", "8.0", "overtime", "0.0"],
+            ["Wed", "03.01.2024", "08:00", "17:00", "60", "8.0", "overtime", "0.0"],
+        ],
     )
-    df.to_csv(logbook.get_path(), sep=";", index=False)
 
     # Call with empty missing_days list
     logbook.df = logbook.load_logbook()
@@ -37,22 +35,17 @@ def test_add_missing_days_empty_missing_days(logbook: lb.Logbook) -> None:
 
 
 @pytest.mark.fast
-def test_add_missing_days_saturday(logbook: lb.Logbook, relative_precision: float) -> None:
+def test_add_missing_days_saturday(logbook: lb.Logbook, relative_precision: float, write_csv: Callable[..., None]) -> None:
     """Test that add_missing_days_to_logbook adds missing Saturday."""
     # Create a logbook with gap that includes a Saturday
-    df = pd.DataFrame(
-        {
-            "weekday": ["Fri", "Mon"],  # Gap includes Saturday
-            "date": ["05.01.2024", "08.01.2024"],  # Fri to Mon (Sat is 06.01.2024)
-            "start_time": ["08:00", "08:00"],
-            "end_time": ["17:00", "17:00"],
-            "lunch_break_duration": [60, 60],
-            "work_time": [8.0, 8.0],
-            "case": ["overtime", "overtime"],
-            "overtime": [0.0, 0.0],
-        },
+    write_csv(
+        logbook.get_path(),
+        _COLUMNS,
+        [
+            ["Fri", "05.01.2024", "08:00", "17:00", 60, 8.0, "overtime", 0.0],
+            ["Mon", "08.01.2024", "08:00", "17:00", 60, 8.0, "overtime", 0.0],
+        ],
     )
-    df.to_csv(logbook.get_path(), sep=";", index=False)
     logbook.df = logbook.load_logbook()
 
     # Missing days: Fri to Mon (should add Saturday and Sunday)
@@ -80,22 +73,17 @@ def test_add_missing_days_saturday(logbook: lb.Logbook, relative_precision: floa
 
 
 @pytest.mark.fast
-def test_add_missing_days_sunday(logbook: lb.Logbook, relative_precision: float) -> None:
+def test_add_missing_days_sunday(logbook: lb.Logbook, relative_precision: float, write_csv: Callable[..., None]) -> None:
     """Test that add_missing_days_to_logbook adds missing Sunday."""
     # Create a logbook with gap that includes a Sunday
-    df = pd.DataFrame(
-        {
-            "weekday": ["Sat", "Mon"],  # Gap includes Sunday
-            "date": ["06.01.2024", "08.01.2024"],  # Sat to Mon (Sun is 07.01.2024)
-            "start_time": ["08:00", "08:00"],
-            "end_time": ["17:00", "17:00"],
-            "lunch_break_duration": [60, 60],
-            "work_time": [8.0, 8.0],
-            "case": ["overtime", "overtime"],
-            "overtime": [0.0, 0.0],
-        },
+    write_csv(
+        logbook.get_path(),
+        _COLUMNS,
+        [
+            ["Sat", "06.01.2024", "08:00", "17:00", 60, 8.0, "overtime", 0.0],
+            ["Mon", "08.01.2024", "08:00", "17:00", 60, 8.0, "overtime", 0.0],
+        ],
     )
-    df.to_csv(logbook.get_path(), sep=";", index=False)
     logbook.df = logbook.load_logbook()
 
     # Missing days: Sat to Mon (should add Sunday)
@@ -123,22 +111,22 @@ def test_add_missing_days_sunday(logbook: lb.Logbook, relative_precision: float)
 
 
 @pytest.mark.fast
-def test_add_missing_days_holiday(logbook: lb.Logbook, relative_precision: float, caplog: pytest.LogCaptureFixture) -> None:
+def test_add_missing_days_holiday(
+    logbook: lb.Logbook,
+    relative_precision: float,
+    caplog: pytest.LogCaptureFixture,
+    write_csv: Callable[..., None],
+) -> None:
     """Test that add_missing_days_to_logbook adds missing holiday."""
     # Create a logbook with gap that includes a holiday (New Year's Day)
-    df = pd.DataFrame(
-        {
-            "weekday": ["Sun", "Tue"],  # Gap includes New Year's Day (01.01.2024)
-            "date": ["31.12.2023", "02.01.2024"],  # Sun to Tue (Mon is 01.01.2024 - New Year's Day)
-            "start_time": ["08:00", "08:00"],
-            "end_time": ["17:00", "17:00"],
-            "lunch_break_duration": [60, 60],
-            "work_time": [8.0, 8.0],
-            "case": ["overtime", "overtime"],
-            "overtime": [0.0, 0.0],
-        },
+    write_csv(
+        logbook.get_path(),
+        _COLUMNS,
+        [
+            ["Sun", "31.12.2023", "08:00", "17:00", 60, 8.0, "overtime", 0.0],
+            ["Tue", "02.01.2024", "08:00", "17:00", 60, 8.0, "overtime", 0.0],
+        ],
     )
-    df.to_csv(logbook.get_path(), sep=";", index=False)
     logbook.df = logbook.load_logbook()
 
     # Missing days: Sun to Tue (should add New Year's Day)
@@ -169,22 +157,17 @@ def test_add_missing_days_holiday(logbook: lb.Logbook, relative_precision: float
 
 
 @pytest.mark.fast
-def test_add_missing_days_multiple_days(logbook: lb.Logbook) -> None:
+def test_add_missing_days_multiple_days(logbook: lb.Logbook, write_csv: Callable[..., None]) -> None:
     """Test that add_missing_days_to_logbook adds multiple missing days."""
     # Create a logbook with gap that includes multiple days
-    df = pd.DataFrame(
-        {
-            "weekday": ["Fri", "Wed"],  # Gap includes Sat, Sun, Mon, Tue
-            "date": ["05.01.2024", "10.01.2024"],  # Fri to Wed
-            "start_time": ["09:00", "09:00"],
-            "end_time": ["17:00", "17:00"],
-            "lunch_break_duration": [60, 60],
-            "work_time": [8.0, 8.0],
-            "case": ["overtime", "overtime"],
-            "overtime": [0.0, 0.0],
-        },
+    write_csv(
+        logbook.get_path(),
+        _COLUMNS,
+        [
+            ["Fri", "05.01.2024", "09:00", "17:00", 60, 8.0, "overtime", 0.0],
+            ["Wed", "10.01.2024", "09:00", "17:00", 60, 8.0, "overtime", 0.0],
+        ],
     )
-    df.to_csv(logbook.get_path(), sep=";", index=False)
     logbook.df = logbook.load_logbook()
 
     # Gap from Fri to Wed (should add Sat, Sun, Mon, Tue)
@@ -213,22 +196,18 @@ def test_add_missing_days_multiple_days(logbook: lb.Logbook) -> None:
 
 
 @pytest.mark.fast
-def test_add_missing_days_already_exists(logbook: lb.Logbook) -> None:
+def test_add_missing_days_already_exists(logbook: lb.Logbook, write_csv: Callable[..., None]) -> None:
     """Test that add_missing_days_to_logbook skips days that already exist."""
     # Create a logbook with Saturday already present
-    df = pd.DataFrame(
-        {
-            "weekday": ["Fri", "Sat", "Mon"],  # Saturday already exists
-            "date": ["05.01.2024", "06.01.2024", "08.01.2024"],
-            "start_time": ["09:00", "09:00", "09:00"],
-            "end_time": ["17:00", "17:00", "17:00"],
-            "lunch_break_duration": [60, 60, 60],
-            "work_time": [8.0, 8.0, 8.0],
-            "case": ["overtime", "overtime", "overtime"],
-            "overtime": [0.0, 0.0, 0.0],
-        },
+    write_csv(
+        logbook.get_path(),
+        _COLUMNS,
+        [
+            ["Fri", "05.01.2024", "09:00", "17:00", 60, 8.0, "overtime", 0.0],
+            ["Sat", "06.01.2024", "09:00", "17:00", 60, 8.0, "overtime", 0.0],
+            ["Mon", "08.01.2024", "09:00", "17:00", 60, 8.0, "overtime", 0.0],
+        ],
     )
-    df.to_csv(logbook.get_path(), sep=";", index=False)
     logbook.df = logbook.load_logbook()
 
     # Missing days: Fri to Mon (Saturday already exists)
@@ -247,22 +226,18 @@ def test_add_missing_days_already_exists(logbook: lb.Logbook) -> None:
 
 
 @pytest.mark.fast
-def test_add_missing_days_multiple_ranges(logbook: lb.Logbook) -> None:
+def test_add_missing_days_multiple_ranges(logbook: lb.Logbook, write_csv: Callable[..., None]) -> None:
     """Test that add_missing_days_to_logbook handles multiple date ranges."""
     # Create a logbook with multiple gaps
-    df = pd.DataFrame(
-        {
-            "weekday": ["Mon", "Wed", "Fri"],
-            "date": ["01.01.2024", "03.01.2024", "05.01.2024"],
-            "start_time": ["09:00", "09:00", "09:00"],
-            "end_time": ["17:00", "17:00", "17:00"],
-            "lunch_break_duration": [60, 60, 60],
-            "work_time": [8.0, 8.0, 8.0],
-            "case": ["overtime", "overtime", "overtime"],
-            "overtime": [0.0, 0.0, 0.0],
-        },
+    write_csv(
+        logbook.get_path(),
+        _COLUMNS,
+        [
+            ["Mon", "01.01.2024", "09:00", "17:00", 60, 8.0, "overtime", 0.0],
+            ["Wed", "03.01.2024", "09:00", "17:00", 60, 8.0, "overtime", 0.0],
+            ["Fri", "05.01.2024", "09:00", "17:00", 60, 8.0, "overtime", 0.0],
+        ],
     )
-    df.to_csv(logbook.get_path(), sep=";", index=False)
     logbook.df = logbook.load_logbook()
 
     # Multiple missing day ranges (Tue and Thu are weekdays, not weekends nor holidays)
@@ -279,22 +254,17 @@ def test_add_missing_days_multiple_ranges(logbook: lb.Logbook) -> None:
 
 
 @pytest.mark.fast
-def test_add_missing_days_sorts_result(logbook: lb.Logbook) -> None:
+def test_add_missing_days_sorts_result(logbook: lb.Logbook, write_csv: Callable[..., None]) -> None:
     """Test that add_missing_days_to_logbook sorts the result by date."""
     # Create a logbook with unsorted dates
-    df = pd.DataFrame(
-        {
-            "weekday": ["Wed", "Mon"],  # Out of order
-            "date": ["03.01.2024", "01.01.2024"],
-            "start_time": ["09:00", "09:00"],
-            "end_time": ["17:00", "17:00"],
-            "lunch_break_duration": ["60", "60"],
-            "work_time": ["8.0", "8.0"],
-            "case": ["overtime", "overtime"],
-            "overtime": ["0.0", "0.0"],
-        },
+    write_csv(
+        logbook.get_path(),
+        _COLUMNS,
+        [
+            ["Wed", "03.01.2024", "09:00", "17:00", "60", "8.0", "overtime", "0.0"],
+            ["Mon", "01.01.2024", "09:00", "17:00", "60", "8.0", "overtime", "0.0"],
+        ],
     )
-    df.to_csv(logbook.get_path(), sep=";", index=False)
     logbook.df = logbook.load_logbook()
 
     # Gap from Mon to Wed (should add Tuesday)
@@ -343,22 +313,17 @@ def test_add_missing_days_with_mock_load_logbook(logbook: lb.Logbook) -> None:
 
 
 @pytest.mark.fast
-def test_add_missing_days_edge_case_single_day_gap(logbook: lb.Logbook) -> None:
+def test_add_missing_days_edge_case_single_day_gap(logbook: lb.Logbook, write_csv: Callable[..., None]) -> None:
     """Test that add_missing_days_to_logbook handles single day gaps correctly."""
     # Create a logbook with single day gap
-    df = pd.DataFrame(
-        {
-            "weekday": ["Mon", "Wed"],  # Gap of one day (Tue)
-            "date": ["01.01.2024", "03.01.2024"],
-            "start_time": ["08:00", "08:00"],
-            "end_time": ["17:00", "17:00"],
-            "lunch_break_duration": ["60", "60"],
-            "work_time": ["8.0", "8.0"],
-            "case": ["overtime", "overtime"],
-            "overtime": ["0.0", "0.0"],
-        },
+    write_csv(
+        logbook.get_path(),
+        _COLUMNS,
+        [
+            ["Mon", "01.01.2024", "08:00", "17:00", "60", "8.0", "overtime", "0.0"],
+            ["Wed", "03.01.2024", "08:00", "17:00", "60", "8.0", "overtime", "0.0"],
+        ],
     )
-    df.to_csv(logbook.get_path(), sep=";", index=False)
     logbook.df = logbook.load_logbook()
 
     # Missing days: Mon to Wed (Tue is weekday, not weekend or holiday)
@@ -372,22 +337,17 @@ def test_add_missing_days_edge_case_single_day_gap(logbook: lb.Logbook) -> None:
 
 
 @pytest.mark.fast
-def test_add_missing_days_no_weekend_nor_holiday(logbook: lb.Logbook) -> None:
+def test_add_missing_days_no_weekend_nor_holiday(logbook: lb.Logbook, write_csv: Callable[..., None]) -> None:
     """Test that add_missing_days_to_logbook does add weekdays that aren't holidays."""
     # Create a logbook with gap that includes only weekdays (no weekends nor holidays)
-    df = pd.DataFrame(
-        {
-            "weekday": ["Mon", "Thu"],  # Gap includes Tue, Wed (weekdays)
-            "date": ["01.01.2024", "04.01.2024"],  # Mon to Thu
-            "start_time": ["08:00", "08:00"],
-            "end_time": ["17:00", "17:00"],
-            "lunch_break_duration": ["60", "60"],
-            "work_time": ["8.0", "8.0"],
-            "case": ["overtime", "overtime"],
-            "overtime": ["0.0", "0.0"],
-        },
+    write_csv(
+        logbook.get_path(),
+        _COLUMNS,
+        [
+            ["Mon", "01.01.2024", "08:00", "17:00", "60", "8.0", "overtime", "0.0"],
+            ["Thu", "04.01.2024", "08:00", "17:00", "60", "8.0", "overtime", "0.0"],
+        ],
     )
-    df.to_csv(logbook.get_path(), sep=";", index=False)
     logbook.df = logbook.load_logbook()
 
     # Missing days: Mon to Thu (Tue, Wed are weekdays, not weekends nor holidays)
@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from datetime import datetime
 from unittest.mock import patch
 
@@ -6,6 +7,8 @@ import pytest
 
 import src.logbook as lb
 
+_COLUMNS = ["weekday", "date", "start_time", "end_time", "lunch_break_duration", "work_time", "case", "overtime"]
+
 
 @pytest.mark.fast
 def test_find_missing_days_empty_logbook(logbook: lb.Logbook) -> None:
@@ -24,22 +27,16 @@ def test_find_missing_days_empty_logbook(logbook: lb.Logbook) -> None:
 
 
 @pytest.mark.fast
-def test_find_missing_days_single_entry(logbook: lb.Logbook) -> None:
+def test_find_missing_days_single_entry(logbook: lb.Logbook, write_csv: Callable[..., None]) -> None:
     """Test that find_missing_days_in_logbook returns empty list for single entry."""
     # Create a logbook with a single entry
-    df = pd.DataFrame(
-        {
-            "weekday": ["Mon"],
-            "date": ["01.01.2024"],
-            "start_time": ["08:00"],
-            "end_time": ["17:30"],
-            "lunch_break_duration": ["60"],
-            "work_time": ["8.0"],
-            "case": ["overtime"],
-            "overtime": ["0.5"],
-        },
+    write_csv(
+        logbook.get_path(),
+        _COLUMNS,
+        [
+            ["Mon", "01.01.2024", "08:00", "17:30", "60", "8.0", "overtime", "0.5"],
+        ],
     )
-    df.to_csv(logbook.get_path(), sep=";", index=False)
     logbook.df = logbook.load_logbook()
     with patch("src.logbook.logger") as mock_logger:
         result = logbook.find_missing_days_in_logbook()
@@ -48,22 +45,18 @@ def test_find_missing_days_single_entry(logbook: lb.Logbook) -> None:
 
 
 @pytest.mark.fast
-def test_find_missing_days_consecutive_days(logbook: lb.Logbook) -> None:
+def test_find_missing_days_consecutive_days(logbook: lb.Logbook, write_csv: Callable[..., None]) -> None:
     """Test that find_missing_days_in_logbook returns empty list for consecutive days."""
     # Create a logbook with consecutive days
-    df = pd.DataFrame(
-        {
-            "weekday": ["Mon", "Tue", "Wed"],
-            "date": ["01.01.2024", "02.01.2024", "03.01.2024"],
-            "start_time": ["08:00", "08:00", "08:00"],
-            "end_time": ["17:00", "17:30", "17:00"],
-            "lunch_break_duration": ["60", "60", "60"],
-            "work_time": ["8.0", "8.0", "8.0"],
-            "case": ["overtime", "overtime", "overtime"],
-            "overtime": ["0.0", "0.5", "0.0"],
-        },
+    write_csv(
+        logbook.get_path(),
+        _COLUMNS,
+        [
+            ["Mon", "01.01.2024", "08:00", "17:00", "60", "8.0", "overtime", "0.0"],
+            ["Tue", "02.01.2024", "08:00", "17:30", "60", "8.0", "overtime", "0.5"],
+            ["Wed", "03.01.2024", "08:00", "17:00", "60", "8.0", "overtime", "0.0"],
+        ],
     )
-    df.to_csv(logbook.get_path(), sep=";", index=False)
     logbook.df = logbook.load_logbook()
     with patch("src.logbook.logger") as mock_logger:
         result = logbook.find_missing_days_in_logbook()
@@ -72,22 +65,17 @@ def test_find_missing_days_consecutive_days(logbook: lb.Logbook) -> None:
 
 
 @pytest.mark.fast
-def test_find_missing_days_single_gap(logbook: lb.Logbook) -> None:
+def test_find_missing_days_single_gap(logbook: lb.Logbook, write_csv: Callable[..., None]) -> None:
     """Test that find_missing_days_in_logbook finds a single gap between dates."""
     # Create a logbook with a gap (missing one day)
-    df = pd.DataFrame(
-        {
-            "weekday": ["Mon", "Wed"],  # Missing Tuesday
-            "date": ["01.01.2024", "03.01.2024"],
-            "start_time": ["08:00", "08:00"],
-            "end_time": ["17:00", "17:30"],
-            "lunch_break_duration": ["60", "60"],
-            "work_time": ["8.0", "8.0"],
-            "case": ["overtime", "overtime"],
-            "overtime": ["0.0", "0.5"],
-        },
+    write_csv(
+        logbook.get_path(),
+        _COLUMNS,
+        [
+            ["Mon", "01.01.2024", "08:00", "17:00", "60", "8.0", "overtime", "0.0"],
+            ["Wed", "03.01.2024", "08:00", "17:30", "60", "8.0", "overtime", "0.5"],
+        ],
     )
-    df.to_csv(logbook.get_path(), sep=";", index=False)
     logbook.df = logbook.load_logbook()
 
     with patch("src.logbook.logger") as mock_logger:
@@ -105,22 +93,18 @@ def test_find_missing_days_single_gap(logbook: lb.Logbook) -> None:
 
 
 @pytest.mark.fast
-def test_find_missing_days_multiple_gaps(logbook: lb.Logbook) -> None:
+def test_find_missing_days_multiple_gaps(logbook: lb.Logbook, write_csv: Callable[..., None]) -> None:
     """Test that find_missing_days_in_logbook finds multiple gaps between dates."""
     # Create a logbook with multiple gaps
-    df = pd.DataFrame(
-        {
-            "weekday": ["Mon", "Wed", "Fri"],  # Missing Tuesday and Thursday
-            "date": ["01.01.2024", "03.01.2024", "05.01.2024"],
-            "start_time": ["08:00", "08:00", "08:00"],
-            "end_time": ["17:15", "17:30", "17:00"],
-            "lunch_break_duration": ["60", "60", "60"],
-            "work_time": ["8.0", "8.0", "8.0"],
-            "case": ["overtime", "overtime", "overtime"],
-            "overtime": ["0.25", "0.5", "0.0"],
-        },
+    write_csv(
+        logbook.get_path(),
+        _COLUMNS,
+        [
+            ["Mon", "01.01.2024", "08:00", "17:15", "60", "8.0", "overtime", "0.25"],
+            ["Wed", "03.01.2024", "08:00", "17:30", "60", "8.0", "overtime", "0.5"],
+            ["Fri", "05.01.2024", "08:00", "17:00", "60", "8.0", "overtime", "0.0"],
+        ],
     )
-    df.to_csv(logbook.get_path(), sep=";", index=False)
     logbook.df = logbook.load_logbook()
 
     with patch("src.logbook.logger") as mock_logger:
@@ -144,22 +128,17 @@ def test_find_missing_days_multiple_gaps(logbook: lb.Logbook) -> None:
 
 
 @pytest.mark.fast
-def test_find_missing_days_large_gap(logbook: lb.Logbook) -> None:
+def test_find_missing_days_large_gap(logbook: lb.Logbook, write_csv: Callable[..., None]) -> None:
     """Test that find_missing_days_in_logbook finds a large gap between dates."""
     # Create a logbook with a large gap (missing several days)
-    df = pd.DataFrame(
-        {
-            "weekday": ["Mon", "Fri"],  # Missing Tue, Wed, Thu
-            "date": ["01.01.2024", "05.01.2024"],
-            "start_time": ["08:00", "08:00"],
-            "end_time": ["17:00", "17:30"],
-            "lunch_break_duration": ["60", "60"],
-            "work_time": ["8.0", "8.0"],
-            "case": ["overtime", "overtime"],
-            "overtime": ["0.0", "0.5"],
-        },
+    write_csv(
+        logbook.get_path(),
+        _COLUMNS,
+        [
+            ["Mon", "01.01.2024", "08:00", "17:00", "60", "8.0", "overtime", "0.0"],
+            ["Fri", "05.01.2024", "08:00", "17:30", "60", "8.0", "overtime", "0.5"],
+        ],
     )
-    df.to_csv(logbook.get_path(), sep=";", index=False)
     logbook.df = logbook.load_logbook()
 
     with patch("src.logbook.logger") as mock_logger:
@@ -176,22 +155,18 @@ def test_find_missing_days_large_gap(logbook: lb.Logbook) -> None:
 
 
 @pytest.mark.fast
-def test_find_missing_days_unsorted_dates(logbook: lb.Logbook) -> None:
+def test_find_missing_days_unsorted_dates(logbook: lb.Logbook, write_csv: Callable[..., None]) -> None:
     """Test that find_missing_days_in_logbook handles unsorted dates correctly."""
     # Create a logbook with unsorted dates
-    df = pd.DataFrame(
-        {
-            "weekday": ["Wed", "Mon", "Fri"],  # Out of order
-            "date": ["03.01.2024", "01.01.2024", "05.01.2024"],
-            "start_time": ["08:00", "08:00", "08:00"],
-            "end_time": ["17:00", "17:00", "17:00"],
-            "lunch_break_duration": ["60", "60", "60"],
-            "work_time": ["8.0", "8.0", "8.0"],
-            "case": ["overtime", "overtime", "overtime"],
-            "overtime": ["0.0", "0.5", "0.0"],
-        },
+    write_csv(
+        logbook.get_path(),
+        _COLUMNS,
+        [
+            ["Wed", "03.01.2024", "08:00", "17:00", "60", "8.0", "overtime", "0.0"],
+            ["Mon", "01.01.2024", "08:00", "17:00", "60", "8.0", "overtime", "0.5"],
+            ["Fri", "05.01.2024", "08:00", "17:00", "60", "8.0", "overtime", "0.0"],
+        ],
     )
-    df.to_csv(logbook.get_path(), sep=";", index=False)
     logbook.df = logbook.load_logbook()
 
     with patch("src.logbook.logger") as mock_logger:
@@ -212,22 +187,17 @@ def test_find_missing_days_unsorted_dates(logbook: lb.Logbook) -> None:
 
 
 @pytest.mark.fast
-def test_find_missing_days_edge_case_same_day(logbook: lb.Logbook) -> None:
+def test_find_missing_days_edge_case_same_day(logbook: lb.Logbook, write_csv: Callable[..., None]) -> None:
     """Test that find_missing_days_in_logbook handles same-day entries correctly."""
     # Create a logbook with same-day entries (should not be considered missing)
-    df = pd.DataFrame(
-        {
-            "weekday": ["Mon", "Mon"],  # Same day, different entries
-            "date": ["01.01.2024", "01.01.2024"],
-            "start_time": ["08:00", "08:00"],
-            "end_time": ["12:00", "17:00"],
-            "lunch_break_duration": ["60", "60"],
-            "work_time": ["3.0", "3.0"],
-            "case": ["overtime", "overtime"],
-            "overtime": ["0.0", "0.5"],
-        },
+    write_csv(
+        logbook.get_path(),
+        _COLUMNS,
+        [
+            ["Mon", "01.01.2024", "08:00", "12:00", "60", "3.0", "overtime", "0.0"],
+            ["Mon", "01.01.2024", "08:00", "17:00", "60", "3.0", "overtime", "0.5"],
+        ],
     )
-    df.to_csv(logbook.get_path(), sep=";", index=False)
     logbook.df = logbook.load_logbook()
 
     with patch("src.logbook.logger") as mock_logger:
@@ -1,4 +1,5 @@
-from unittest.mock import patch
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
 
 import pandas as pd
 import pytest
@@ -6,6 +7,13 @@ import pytest
 import src.logbook as lb
 
 
+@pytest.fixture
+def patched_to_csv() -> Iterator[MagicMock]:
+    """Fixture to patch DataFrame.to_csv at class level so save_logbook never writes to disk."""
+    with patch.object(pd.DataFrame, "to_csv") as mock_to_csv:
+        yield mock_to_csv
+
+
 @pytest.mark.fast
 def test_load_logbook_file_not_found_error_with_mock_read_csv(logbook: lb.Logbook) -> None:
     """Test that load_logbook handles FileNotFoundError gracefully by mocking pd.read_csv."""
@@ -48,16 +56,8 @@ def test_load_logbook_parser_error_with_mock_read_csv(logbook: lb.Logbook) -> No
 @pytest.mark.fast
 def test_load_logbook_missing_required_columns(logbook: lb.Logbook) -> None:
     """Test that load_logbook raises KeyError when required columns are missing."""
-    # Create a CSV file with missing columns
-    df = pd.DataFrame(
-        {
-            "weekday": ["Mon"],
-            "date": ["01.01.2024"],
-            "start_time": ["09:00"],
-            # Missing: end_time, lunch_break_duration, work_time, case, overtime
-        },
-    )
-    df.to_csv(logbook.get_path(), sep=";", index=False)
+    # Create a CSV file with missing columns: end_time, lunch_break_duration, work_time, case, overtime
+    logbook.get_path().write_text("weekday;date;start_time\nMon;01.01.2024;09:00\n", encoding="utf-8")
 
     with pytest.raises(KeyError) as exc_info:
         logbook.load_logbook()
@@ -68,21 +68,12 @@ def test_load_logbook_missing_required_columns(logbook: lb.Logbook) -> None:
 @pytest.mark.fast
 def test_load_logbook_unexpected_number_of_columns(logbook: lb.Logbook) -> None:
     """Test that load_logbook raises ValueError when there are unexpected number of columns."""
-    # Create a CSV file with extra columns
-    df = pd.DataFrame(
-        {
-            "weekday": ["Mon"],
-            "date": ["01.01.2024"],
-            "start_time": ["09:00"],
-            "end_time": ["17:00"],
-            "lunch_break_duration": ["1.0"],
-            "work_time": ["8.0"],
-            "case": ["normal"],
-            "overtime": ["0.0"],
-            "extra_column": ["extra_value"],  # Extra column
-        },
+    # Create a CSV file with an extra column
+    logbook.get_path().write_text(
+        "weekday;date;start_time;end_time;lunch_break_duration;work_time;case;overtime;extra_column\n"
+        "Mon;01.01.2024;09:00;17:00;1.0;8.0;normal;0.0;extra_value\n",
+        encoding="utf-8",
     )
-    logbook.save_logbook(df)
 
     with pytest.raises(ValueError, match="Log file has an unexpected number of columns") as exc_info:
         logbook.load_logbook()
@@ -91,9 +82,15 @@ def test_load_logbook_unexpected_number_of_columns(logbook: lb.Logbook) -> None:
 
 
 @pytest.mark.fast
-def test_save_logbook_permission_error(logbook: lb.Logbook) -> None:
-    """Test that save_logbook raises PermissionError when permission is denied."""
-    # Create a test DataFrame
+@pytest.mark.parametrize(
+    ("error", "message"),
+    [
+        (PermissionError("Permission denied"), "Permission denied when saving logbook"),
+        (OSError("Disk full"), "OS error while saving logbook"),
+    ],
+)
+def test_save_logbook_write_errors(logbook: lb.Logbook, patched_to_csv: MagicMock, error: OSError, message: str) -> None:
+    """Test that save_logbook re-raises write errors with a descriptive message."""
     df = pd.DataFrame(
         {
             "weekday": ["Mon"],
@@ -106,44 +103,14 @@ def test_save_logbook_permission_error(logbook: lb.Logbook) -> None:
             "overtime": ["0.0"],
         },
     )
+    patched_to_csv.side_effect = error
 
-    # Mock pd.DataFrame.to_csv to raise PermissionError
-    with patch.object(df, "to_csv", side_effect=PermissionError("Permission denied")):
-        with pytest.raises(PermissionError) as exc_info:
-            logbook.save_logbook(df)
-
-        # Verify that the exception message is correct
-        assert "Permission denied when saving logbook" in str(exc_info.value)
-
-
-@pytest.mark.fast
-def test_save_logbook_os_error(logbook: lb.Logbook) -> None:
-    """Test that save_logbook raises OSError when OS error occurs."""
-    # Create a test DataFrame
-    df = pd.DataFrame(
-        {
-            "weekday": ["Mon"],
-            "date": ["01.01.2024"],
-            "start_time": ["09:00"],
-            "end_time": ["17:00"],
-            "lunch_break_duration": ["1.0"],
-            "work_time": ["8.0"],
-            "case": ["normal"],
-            "overtime": ["0.0"],
-        },
-    )
-
-    # Mock pd.DataFrame.to_csv to raise OSError
-    with patch.object(df, "to_csv", side_effect=OSError("Disk full")):
-        with pytest.raises(OSError, match="OS error while saving logbook") as exc_info:
-            logbook.save_logbook(df)
-
-        # Verify that the exception message is correct
-        assert "OS error while saving logbook" in str(exc_info.value)
+    with pytest.raises(type(error), match=message):
+        logbook.save_logbook(df)
 
 
 @pytest.mark.fast
-def test_save_logbook_with_timestamp_date_column(logbook: lb.Logbook) -> None:
+def test_save_logbook_with_timestamp_date_column(logbook: lb.Logbook, patched_to_csv: MagicMock) -> None:
     """Test that save_logbook converts timestamp date column to string format."""
     # Create a test DataFrame with timestamp date column
     df = pd.DataFrame(
@@ -159,16 +126,14 @@ def test_save_logbook_with_timestamp_date_column(logbook: lb.Logbook) -> None:
         },
     )
 
-    # Mock the to_csv method to avoid actual file writing
-    with patch.object(df, "to_csv") as mock_to_csv:
-        logbook.save_logbook(df)
+    logbook.save_logbook(df)
 
-        # Verify that to_csv was called
-        mock_to_csv.assert_called_once()
+    # Verify that to_csv was called
+    patched_to_csv.assert_called_once()
 
-        # Verify that the date column was converted to string format
-        # The date should be in the format specified by logbook.date_format
-        assert isinstance(df["date"].iloc[0], str)
+    # Verify that the date column was converted to string format
+    # The date should be in the format specified by logbook.date_format
+    assert isinstance(df["date"].iloc[0], str)
 
 
 @pytest.mark.fast
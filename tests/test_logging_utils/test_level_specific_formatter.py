@@ -6,6 +6,21 @@ import pytest
 
 import src.logging_utils as lu
 
+# Attributes shared by every record in the formatting tests
+_RECORD_TEMPLATE = {"name": "test_logger", "pathname": "test_file.py", "filename": "test_file.py", "lineno": 42}
+
+
+@pytest.fixture(scope="module")
+def formatter() -> lu.LevelSpecificFormatter:
+    """Fixture to share one LevelSpecificFormatter across the formatting tests; it holds no per-record state."""
+    return lu.LevelSpecificFormatter()
+
+
+@pytest.fixture(scope="module")
+def base_record() -> logging.LogRecord:
+    """Fixture to share one LogRecord that the formatting cases update in place instead of building a new one each."""
+    return logging.makeLogRecord(_RECORD_TEMPLATE)
+
 
 @pytest.mark.fast
 def test_formatter_initialization() -> None:
@@ -25,118 +40,42 @@ def test_formatter_initialization() -> None:
 
 
 @pytest.mark.fast
-def test_format_debug_level() -> None:
-    """Test formatting for DEBUG level."""
-    formatter = lu.LevelSpecificFormatter()
-    record = logging.LogRecord(
-        name="test_logger",
-        level=logging.DEBUG,
-        pathname="test_file.py",
-        lineno=42,
-        msg="Debug message",
-        args=(),
-        exc_info=None,
-    )
-    record.funcName = "test_function"
-
-    formatted = formatter.format(record)
-    expected = "DEBUG - test_function in line 42 - Debug message"
-    assert formatted == expected
-
-
-@pytest.mark.fast
-def test_format_info_level() -> None:
-    """Test formatting for INFO level."""
-    formatter = lu.LevelSpecificFormatter()
-    record = logging.LogRecord(
-        name="test_logger",
-        level=logging.INFO,
-        pathname="test_file.py",
-        lineno=42,
-        msg="Info message",
-        args=(),
-        exc_info=None,
-    )
-
-    formatted = formatter.format(record)
-    expected = "Info message"
-    assert formatted == expected
-
-
-@pytest.mark.fast
-def test_format_warning_level() -> None:
-    """Test formatting for WARNING level."""
-    formatter = lu.LevelSpecificFormatter()
-    record = logging.LogRecord(
-        name="test_logger",
-        level=logging.WARNING,
-        pathname="test_file.py",
-        lineno=42,
-        msg="Warning message",
-        args=(),
-        exc_info=None,
-    )
-
-    formatted = formatter.format(record)
-    expected = "WARNING: Warning message"
-    assert formatted == expected
-
-
-@pytest.mark.fast
-def test_format_error_level() -> None:
-    """Test formatting for ERROR level."""
-    formatter = lu.LevelSpecificFormatter()
-    record = logging.LogRecord(
-        name="test_logger",
-        level=logging.ERROR,
-        pathname="test_file.py",
-        lineno=42,
-        msg="Error message",
-        args=(),
-        exc_info=None,
-    )
-    record.funcName = "test_function"
-
-    formatted = formatter.format(record)
-    expected = "ERROR: test_function - Error message"
-    assert formatted == expected
-
-
-@pytest.mark.fast
-def test_format_critical_level() -> None:
-    """Test formatting for CRITICAL level."""
-    formatter = lu.LevelSpecificFormatter()
-    record = logging.LogRecord(
-        name="test_logger",
-        level=logging.CRITICAL,
-        pathname="test_file.py",
-        lineno=42,
-        msg="Critical message",
-        args=(),
-        exc_info=None,
-    )
-    record.funcName = "test_function"
-    record.filename = "test_file.py"
-
-    formatted = formatter.format(record)
-    expected = "CRITICAL: test_function in test_file.py:42 - Critical message"
-    assert formatted == expected
-
-
-@pytest.mark.fast
-def test_format_unknown_level() -> None:
-    """Test formatting for unknown level falls back to INFO format."""
-    formatter = lu.LevelSpecificFormatter()
-    record = logging.LogRecord(
-        name="test_logger",
-        level=999,  # Unknown level
-        pathname="test_file.py",
-        lineno=42,
-        msg="Unknown level message",
-        args=(),
-        exc_info=None,
-    )
-
-    formatted = formatter.format(record)
-    expected = "Unknown level message"
-    assert formatted == expected
+@pytest.mark.parametrize(
+    ("level", "fields", "expected"),
+    [
+        pytest.param(
+            logging.DEBUG,
+            {"msg": "Debug message", "funcName": "test_function"},
+            "DEBUG - test_function in line 42 - Debug message",
+            id="debug",
+        ),
+        pytest.param(logging.INFO, {"msg": "Info message"}, "Info message", id="info"),
+        pytest.param(logging.WARNING, {"msg": "Warning message"}, "WARNING: Warning message", id="warning"),
+        pytest.param(
+            logging.ERROR,
+            {"msg": "Error message", "funcName": "test_function"},
+            "ERROR: test_function - Error message",
+            id="error",
+        ),
+        pytest.param(
+            logging.CRITICAL,
+            {"msg": "Critical message", "funcName": "test_function", "filename": "test_file.py"},
+            "CRITICAL: test_function in test_file.py:42 - Critical message",
+            id="critical",
+        ),
+        # Unknown levels fall back to the INFO format
+        pytest.param(999, {"msg": "Unknown level message"}, "Unknown level message", id="unknown"),
+    ],
+)
+def test_format_level(
+    formatter: lu.LevelSpecificFormatter,
+    base_record: logging.LogRecord,
+    level: int,
+    fields: dict,
+    expected: str,
+) -> None:
+    """Test that each log level is formatted with its level-specific format."""
+    # Reset funcName so fields from a previous case do not leak into this one
+    base_record.__dict__.update({"levelno": level, "levelname": logging.getLevelName(level), "funcName": None, **fields})
+
+    assert formatter.format(base_record) == expected
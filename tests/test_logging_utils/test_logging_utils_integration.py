@@ -1,18 +1,21 @@
 """Tests for the logging utilities module."""
 
 import logging
+from collections.abc import Callable
 
 import pytest
 
 import src.logging_utils as lu
 
+pytestmark = pytest.mark.usefixtures("restore_log_levels")
+
 
 @pytest.mark.fast
 @pytest.mark.integration
-def test_logging_utils_integration() -> None:
+def test_logging_utils_integration(throwaway_logger: Callable[[str], logging.Logger]) -> None:
     """Integration test for logging utilities."""
     # Test the complete flow
-    logger_name = "integration_test_logger"
+    logger_name = throwaway_logger("integration").name
     level = logging.DEBUG
 
     # Setup logger
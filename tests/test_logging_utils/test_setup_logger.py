@@ -1,6 +1,7 @@
 """Tests for the logging utilities module."""
 
 import logging
+from collections.abc import Callable
 
 import pytest
 
@@ -8,35 +9,32 @@ import src.logging_utils as lu
 
 
 @pytest.mark.fast
-def test_setup_logger_basic() -> None:
-    """Test basic logger setup without level specification."""
-    logger_name = "test_logger"
-    logger = lu.setup_logger(logger_name)
+@pytest.mark.parametrize(
+    ("kwargs", "expected_level"),
+    [
+        pytest.param({}, logging.NOTSET, id="default"),
+        pytest.param({"level": None}, logging.NOTSET, id="none"),  # When level is None, logger level should be NOTSET (0)
+        pytest.param({"level": logging.DEBUG}, logging.DEBUG, id="debug"),
+        pytest.param({"level": logging.INFO}, logging.INFO, id="info"),
+    ],
+)
+def test_setup_logger_level(throwaway_logger: Callable[[str], logging.Logger], kwargs: dict, expected_level: int) -> None:
+    """Test that setup_logger attaches one formatted StreamHandler and only sets the level when one is given."""
+    logger_name = throwaway_logger("logger").name
+    logger = lu.setup_logger(logger_name, **kwargs)
 
     assert isinstance(logger, logging.Logger)
     assert logger.name == logger_name
+    assert logger.level == expected_level
     assert len(logger.handlers) == 1
     assert isinstance(logger.handlers[0], logging.StreamHandler)
     assert isinstance(logger.handlers[0].formatter, lu.LevelSpecificFormatter)
 
 
 @pytest.mark.fast
-def test_setup_logger_with_level() -> None:
-    """Test logger setup with specific level."""
-    logger_name = "test_logger_with_level"
-    level = logging.DEBUG
-    logger = lu.setup_logger(logger_name, level)
-
-    assert isinstance(logger, logging.Logger)
-    assert logger.name == logger_name
-    assert logger.level == level
-    assert len(logger.handlers) == 1
-
-
-@pytest.mark.fast
-def test_setup_logger_existing_logger() -> None:
+def test_setup_logger_existing_logger(throwaway_logger: Callable[[str], logging.Logger]) -> None:
     """Test that setup_logger doesn't add duplicate handlers to existing logger."""
-    logger_name = "test_existing_logger"
+    logger_name = throwaway_logger("existing_logger").name
 
     # Create logger first time
     logger1 = lu.setup_logger(logger_name)
@@ -53,9 +51,9 @@ def test_setup_logger_existing_logger() -> None:
 
 
 @pytest.mark.fast
-def test_setup_logger_different_levels() -> None:
+def test_setup_logger_different_levels(throwaway_logger: Callable[[str], logging.Logger]) -> None:
     """Test that setup_logger can set different levels for same logger."""
-    logger_name = "test_level_logger"
+    logger_name = throwaway_logger("level_logger").name
 
     # Setup with DEBUG level
     logger1 = lu.setup_logger(logger_name, logging.DEBUG)
@@ -65,24 +63,3 @@ def test_setup_logger_different_levels() -> None:
     logger2 = lu.setup_logger(logger_name, logging.INFO)
     assert logger2.level == logging.INFO
     assert logger1 is logger2  # Same logger instance
-
-
-@pytest.mark.fast
-def test_setup_logger_none_level() -> None:
-    """Test that setup_logger handles None level correctly."""
-    logger_name = "test_none_level_logger"
-    logger = lu.setup_logger(logger_name, None)
-
-    assert isinstance(logger, logging.Logger)
-    # When level is None, logger level should be NOTSET (0)
-    assert logger.level == logging.NOTSET
-
-
-@pytest.mark.fast
-def test_setup_logger_handler_formatter() -> None:
-    """Test that the handler has the correct formatter."""
-    logger_name = "test_formatter_logger"
-    logger = lu.setup_logger(logger_name)
-
-    handler = logger.handlers[0]
-    assert isinstance(handler.formatter, lu.LevelSpecificFormatter)
@@ -19,24 +19,29 @@ import src.time_recorder as tr
     ],
 )
 @pytest.mark.fast
-def test_calculate_overtime_cases(line: tr.TimeRecorder, work_time: timedelta, expected_case: str, expected_delta: timedelta) -> None:
+def test_calculate_overtime_cases(
+    line_readonly: tr.TimeRecorder,
+    work_time: timedelta,
+    expected_case: str,
+    expected_delta: timedelta,
+) -> None:
     """Test calculate_overtime returns correct case and timedelta."""
-    case, overtime = line.calculate_overtime(work_time)
+    case, overtime = line_readonly.calculate_overtime(work_time)
     assert case == expected_case
     assert overtime == expected_delta
 
 
 @pytest.mark.fast
-def test_calculate_overtime_negative_work_time(line: tr.TimeRecorder) -> None:
+def test_calculate_overtime_negative_work_time(line_readonly: tr.TimeRecorder) -> None:
     """Test calculate_overtime with negative work_time returns undertime with increased delta."""
-    case, overtime = line.calculate_overtime(timedelta(hours=-2))
+    case, overtime = line_readonly.calculate_overtime(timedelta(hours=-2))
     assert case == "undertime"
     assert overtime == timedelta(hours=-10)
 
 
 @pytest.mark.fast
-def test_calculate_overtime_type_annotations(line: tr.TimeRecorder) -> None:
+def test_calculate_overtime_type_annotations(line_readonly: tr.TimeRecorder) -> None:
     """Test that calculate_overtime returns a tuple of (str, timedelta)."""
-    case, overtime = line.calculate_overtime(timedelta(hours=8))
+    case, overtime = line_readonly.calculate_overtime(timedelta(hours=8))
     assert isinstance(case, str)
     assert isinstance(overtime, timedelta)
@@ -4,6 +4,8 @@ import pytest
 
 import src.time_recorder as tr
 
+_DAY = (2025, 4, 24)
+
 
 @pytest.mark.fast
 def test_standard_duration(line: tr.TimeRecorder) -> None:
@@ -14,52 +16,47 @@ def test_standard_duration(line: tr.TimeRecorder) -> None:
 
 
 @pytest.mark.fast
-def test_no_lunch_break(line: tr.TimeRecorder) -> None:
-    """Test that work duration is correct when there is no lunch break."""
-    line.lunch_break_duration = timedelta(minutes=0)
-    line.start_time = datetime.strptime("24.04.2025 09:00:00", "%d.%m.%Y %H:%M:%S")
-    line.end_time = datetime.strptime("24.04.2025 17:00:00", "%d.%m.%Y %H:%M:%S")
-    duration = line.calculate_work_duration()
-    assert duration == timedelta(hours=8)
+@pytest.mark.parametrize(
+    ("start", "end", "lunch_minutes", "expected"),
+    [
+        pytest.param((9, 0), (17, 0), 0, timedelta(hours=8), id="no_lunch_break"),
+        pytest.param((13, 15), (15, 45), 15, timedelta(hours=2, minutes=15), id="short_shift"),
+    ],
+)
+def test_work_duration(
+    line: tr.TimeRecorder,
+    start: tuple[int, int],
+    end: tuple[int, int],
+    lunch_minutes: int,
+    expected: timedelta,
+) -> None:
+    """Test that the work duration is the shift length minus the lunch break."""
+    line.start_time = datetime(*_DAY, *start)
+    line.end_time = datetime(*_DAY, *end)
+    line.lunch_break_duration = timedelta(minutes=lunch_minutes)
+    assert line.calculate_work_duration() == expected
 
 
 @pytest.mark.fast
-def test_short_shift(line: tr.TimeRecorder) -> None:
-    """Test that a short shift with a lunch break calculates the correct duration."""
-    line.start_time = datetime.strptime("24.04.2025 13:15:00", "%d.%m.%Y %H:%M:%S")
-    line.end_time = datetime.strptime("24.04.2025 15:45:00", "%d.%m.%Y %H:%M:%S")
-    line.lunch_break_duration = timedelta(minutes=15)
-    duration = line.calculate_work_duration()
-    assert duration == timedelta(hours=2, minutes=15)
-
-
-@pytest.mark.fast
-def test_start_time_after_end_time_raises(line: tr.TimeRecorder) -> None:
-    """Test that providing a start time after the end time raises a ValueError."""
-    line.start_time = datetime.strptime("24.04.2025 18:00:00", "%d.%m.%Y %H:%M:%S")
-    line.end_time = datetime.strptime("24.04.2025 16:00:00", "%d.%m.%Y %H:%M:%S")
-    with pytest.raises(ValueError, match=r"The start time must be before the end time."):
-        line.calculate_work_duration()
-
-
-@pytest.mark.fast
-def test_negative_lunch_break_raises(line: tr.TimeRecorder) -> None:
-    """Test that a negative lunch break duration raises a ValueError."""
-    line.lunch_break_duration = timedelta(minutes=-10)
-    with pytest.raises(ValueError, match=r"The lunch break duration must be a non-negative integer."):
-        line.calculate_work_duration()
-
-
-@pytest.mark.fast
-def test_zero_or_negative_work_duration_raises(line: tr.TimeRecorder) -> None:
-    """Test that zero or negative work duration raises a ValueError."""
-    line.start_time = datetime.strptime("24.04.2025 08:00:00", "%d.%m.%Y %H:%M:%S")
-    line.end_time = datetime.strptime("24.04.2025 08:30:00", "%d.%m.%Y %H:%M:%S")
-    line.lunch_break_duration = timedelta(minutes=30)
-    with pytest.raises(ValueError, match=r"The work duration must be positive."):
-        line.calculate_work_duration()
-
-    line.end_time = datetime.strptime("24.04.2025 08:20:00", "%d.%m.%Y %H:%M:%S")
-    line.lunch_break_duration = timedelta(minutes=30)
-    with pytest.raises(ValueError, match=r"The work duration must be positive."):
+@pytest.mark.parametrize(
+    ("start", "end", "lunch_minutes", "match"),
+    [
+        pytest.param((18, 0), (16, 0), 0, r"The start time must be before the end time.", id="start_after_end"),
+        pytest.param((8, 0), (16, 0), -10, r"The lunch break duration must be a non-negative integer.", id="negative_lunch_break"),
+        pytest.param((8, 0), (8, 30), 30, r"The work duration must be positive.", id="zero_work_duration"),
+        pytest.param((8, 0), (8, 20), 30, r"The work duration must be positive.", id="negative_work_duration"),
+    ],
+)
+def test_invalid_work_duration_raises(
+    line: tr.TimeRecorder,
+    start: tuple[int, int],
+    end: tuple[int, int],
+    lunch_minutes: int,
+    match: str,
+) -> None:
+    """Test that inconsistent start, end and lunch break values raise a ValueError."""
+    line.start_time = datetime(*_DAY, *start)
+    line.end_time = datetime(*_DAY, *end)
+    line.lunch_break_duration = timedelta(minutes=lunch_minutes)
+    with pytest.raises(ValueError, match=match):
         line.calculate_work_duration()
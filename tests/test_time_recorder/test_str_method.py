@@ -1,380 +1,106 @@
 """Unit tests for the TimeRecorder __str__ method."""
 
+import re
+from collections.abc import Callable
+from copy import copy
+
 import pytest
 
 import src.time_recorder as tr
 
-
-@pytest.mark.fast
-def test_str_overtime_case() -> None:
-    """Test __str__ method with overtime case."""
-    # Create a TimeRecorder with overtime (8.5 hours work time)
-    line = tr.TimeRecorder(
-        {
-            "date": "24.04.2025",
-            "start_time": "08:00",
-            "end_time": "17:30",  # 9.5 hours total, 1 hour lunch = 8.5 hours work
-            "end_now": False,
-            "lunch_break_duration": 60,
-            "timezone": "Europe/Berlin",
-            "full_format": "%d.%m.%Y %H:%M:%S",
-            "standard_work_hours": 8,
-        },
-    )
-
-    result = str(line)
-
-    assert "Time Recorder - Work Hours Calculator" in result
-    assert "📅 Date:" in result
-    assert "⏰ Start time: 08:00" in result
-    assert "⏰ End time: 17:30" in result
-    assert "🍽️  Lunch break: 60m" in result
-    assert "⏱️  Work duration: 8h 30m (8.5h)" in result
-    assert "📈 Status:" in result
-    assert "overtime" in result
-    assert "0h 30m (0.5h)" in result
-
-
-@pytest.mark.fast
-def test_str_undertime_case() -> None:
-    """Test __str__ method with undertime case."""
-    # Create a TimeRecorder with undertime (7.5 hours work time)
-    line = tr.TimeRecorder(
-        {
-            "date": "24.04.2025",
-            "start_time": "08:00",
-            "end_time": "16:30",  # 8.5 hours total, 1 hour lunch = 7.5 hours work
-            "end_now": False,
-            "lunch_break_duration": 60,
-            "timezone": "Europe/Berlin",
-            "full_format": "%d.%m.%Y %H:%M:%S",
-            "standard_work_hours": 8,
-        },
-    )
-
-    result = str(line)
-
-    assert "Time Recorder - Work Hours Calculator" in result
-    assert "📅 Date:" in result
-    assert "⏰ Start time: 08:00" in result
-    assert "⏰ End time: 16:30" in result
-    assert "🍽️  Lunch break: 60m" in result
-    assert "⏱️  Work duration: 7h 30m (7.5h)" in result
-    assert "📈 Status:" in result
-    assert "undertime" in result
-    assert "0h -30m (-0.5h)" in result
-
-
-@pytest.mark.fast
-def test_str_exact_8_hours() -> None:
-    """Test __str__ method with exactly 8 hours work time (borderline case)."""
-    # Create a TimeRecorder with exactly 8 hours work time
-    line = tr.TimeRecorder(
-        {
-            "date": "24.04.2025",
-            "start_time": "08:00",
-            "end_time": "17:00",  # 9 hours total, 1 hour lunch = 8 hours work
-            "end_now": False,
-            "lunch_break_duration": 60,
-            "timezone": "Europe/Berlin",
-            "full_format": "%d.%m.%Y %H:%M:%S",
-            "standard_work_hours": 8,
-        },
-    )
-
-    result = str(line)
+pytestmark = pytest.mark.fast
+
+# Status line: coloured case name followed by the overtime delta
+_STATUS_RE = re.compile(r"^📈 Status: \x1b\[\d+m(?P<case>\w+)\x1b\[0m (?P<delta>.+)$", re.MULTILINE)
+# One line per report field, in order, for an undertime day
+_STRUCTURE_RE = re.compile(
+    r"\n"
+    r"Time Recorder - Work Hours Calculator\n"
+    r"=====================================\n"
+    r"📅 Date: [^\n]+\n"
+    r"⏰ Start time: [^\n]+\n"
+    r"⏰ End time: [^\n]+\n"
+    r"🍽️  Lunch break: [^\n]+\n"
+    r"⏱️  Work duration: [^\n]+\n"
+    r"📈 Status: [^\n]+\n"
+    r"🏁 End of workday would be at [^\n]+",
+)
+
+
+@pytest.mark.parametrize(
+    ("end_time", "lunch_break_duration", "work_duration", "status"),
+    [
+        # 9.5 hours total, 1 hour lunch = 8.5 hours work
+        pytest.param("17:30", 60, "8h 30m (8.5h)", ("overtime", "0h 30m (0.5h)"), id="overtime"),
+        # 8.5 hours total, 1 hour lunch = 7.5 hours work
+        pytest.param("16:30", 60, "7h 30m (7.5h)", ("undertime", "0h -30m (-0.5h)"), id="undertime"),
+        # 9 hours total, 1 hour lunch = 8 hours work (borderline case)
+        pytest.param("17:00", 60, "8h 0m (8.0h)", ("overtime", "0h 0m (0.0h)"), id="exact_8_hours"),
+        # 7 hours total, 1 hour lunch = 6 hours work
+        pytest.param("15:00", 60, "6h 0m (6.0h)", ("undertime", "-2h 0m (-2.0h)"), id="negative_overtime"),
+        # 11 hours total, 1 hour lunch = 10 hours work
+        pytest.param("19:00", 60, "10h 0m (10.0h)", ("overtime", "2h 0m (2.0h)"), id="large_overtime"),
+        # 8h 45m total, 1 hour lunch = 7h 45m work
+        pytest.param("16:45", 60, "7h 45m (7.75h)", ("undertime", "0h -15m (-0.25h)"), id="partial_hours_and_minutes"),
+        # 8h 20m total, 1 hour lunch = 7h 20m work, shown with two decimals
+        pytest.param("16:20", 60, "7h 20m (7.33h)", ("undertime", "0h -40m (-0.67h)"), id="decimal_precision"),
+        # 1 minute work
+        pytest.param("08:01", 0, "0h 1m (0.02h)", ("undertime", "-7h -59m (-7.98h)"), id="minimal_work_time"),
+    ],
+)
+def test_str_content(
+    time_recorder_factory: Callable[..., tr.TimeRecorder],
+    end_time: str,
+    lunch_break_duration: int,
+    work_duration: str,
+    status: tuple[str, str],
+) -> None:
+    """Test that __str__ reports the times, work duration and overtime status for each case."""
+    result = str(time_recorder_factory(end_time=end_time, lunch_break_duration=lunch_break_duration))
 
     assert "Time Recorder - Work Hours Calculator" in result
     assert "📅 Date:" in result
     assert "⏰ Start time: 08:00" in result
-    assert "⏰ End time: 17:00" in result
-    assert "🍽️  Lunch break: 60m" in result
-    assert "⏱️  Work duration: 8h 0m (8.0h)" in result
-    assert "📈 Status:" in result
-    assert "overtime" in result
-    assert "0h 0m (0.0h)" in result
-
-
-@pytest.mark.fast
-def test_str_negative_overtime() -> None:
-    """Test __str__ method with negative overtime (undertime)."""
-    # Create a TimeRecorder with significant undertime (6 hours work time)
-    line = tr.TimeRecorder(
-        {
-            "date": "24.04.2025",
-            "start_time": "08:00",
-            "end_time": "15:00",  # 7 hours total, 1 hour lunch = 6 hours work
-            "end_now": False,
-            "lunch_break_duration": 60,
-            "timezone": "Europe/Berlin",
-            "full_format": "%d.%m.%Y %H:%M:%S",
-            "standard_work_hours": 8,
-        },
-    )
-
-    result = str(line)
-
-    assert "Time Recorder - Work Hours Calculator" in result
-    assert "📅 Date:" in result
-    assert "⏰ Start time: 08:00" in result
-    assert "⏰ End time: 15:00" in result
-    assert "🍽️  Lunch break: 60m" in result
-    assert "⏱️  Work duration: 6h 0m (6.0h)" in result
-    assert "📈 Status:" in result
-    assert "undertime" in result
-    assert "-2h 0m (-2.0h)" in result
-
-
-@pytest.mark.fast
-def test_str_large_overtime() -> None:
-    """Test __str__ method with large overtime."""
-    # Create a TimeRecorder with large overtime (10 hours work time)
-    line = tr.TimeRecorder(
-        {
-            "date": "24.04.2025",
-            "start_time": "08:00",
-            "end_time": "19:00",  # 11 hours total, 1 hour lunch = 10 hours work
-            "end_now": False,
-            "lunch_break_duration": 60,
-            "timezone": "Europe/Berlin",
-            "full_format": "%d.%m.%Y %H:%M:%S",
-            "standard_work_hours": 8,
-        },
-    )
-
-    result = str(line)
-
-    assert "Time Recorder - Work Hours Calculator" in result
-    assert "📅 Date:" in result
-    assert "⏰ Start time: 08:00" in result
-    assert "⏰ End time: 19:00" in result
-    assert "🍽️  Lunch break: 60m" in result
-    assert "⏱️  Work duration: 10h 0m (10.0h)" in result
-    assert "📈 Status:" in result
-    assert "overtime" in result
-    assert "2h 0m (2.0h)" in result
-
-
-@pytest.mark.fast
-def test_str_partial_hours_and_minutes() -> None:
-    """Test __str__ method with partial hours and minutes."""
-    # Create a TimeRecorder with complex time (7 hours 45 minutes work time)
-    line = tr.TimeRecorder(
-        {
-            "date": "24.04.2025",
-            "start_time": "08:00",
-            "end_time": "16:45",  # 8 hours 45 minutes total, 1 hour lunch = 7 hours 45 minutes work
-            "end_now": False,
-            "lunch_break_duration": 60,
-            "timezone": "Europe/Berlin",
-            "full_format": "%d.%m.%Y %H:%M:%S",
-            "standard_work_hours": 8,
-        },
-    )
-
-    result = str(line)
-
-    assert "Time Recorder - Work Hours Calculator" in result
-    assert "📅 Date:" in result
-    assert "⏰ Start time: 08:00" in result
-    assert "⏰ End time: 16:45" in result
-    assert "🍽️  Lunch break: 60m" in result
-    assert "⏱️  Work duration: 7h 45m (7.75h)" in result
-    assert "📈 Status:" in result
-    assert "undertime" in result
-    assert "0h -15m (-0.25h)" in result
-
-
-@pytest.mark.fast
-def test_str_invalid_case_raises_value_error() -> None:
-    """Test that __str__ raises ValueError for invalid case values."""
-    # Create a TimeRecorder and manually set an invalid case
-    line = tr.TimeRecorder(
-        {
-            "date": "24.04.2025",
-            "start_time": "08:00",
-            "end_time": "16:00",
-            "end_now": False,
-            "lunch_break_duration": 60,
-            "timezone": "Europe/Berlin",
-            "full_format": "%d.%m.%Y %H:%M:%S",
-            "standard_work_hours": 8,
-        },
-    )
-
-    # Manually set an invalid case
-    line.case = "invalid_case"
-
-    with pytest.raises(ValueError, match="Unexpected value for case: invalid_case"):
-        str(line)
-
-
-@pytest.mark.fast
-def test_str_empty_case_raises_value_error() -> None:
-    """Test that __str__ raises ValueError for empty case value."""
-    # Create a TimeRecorder and manually set an empty case
-    line = tr.TimeRecorder(
-        {
-            "date": "24.04.2025",
-            "start_time": "08:00",
-            "end_time": "16:00",
-            "end_now": False,
-            "lunch_break_duration": 60,
-            "timezone": "Europe/Berlin",
-            "full_format": "%d.%m.%Y %H:%M:%S",
-            "standard_work_hours": 8,
-        },
-    )
-
-    # Manually set an empty case
-    line.case = ""
-
-    with pytest.raises(ValueError, match=r"Unexpected value for case: . Expected 'overtime' or 'undertime'."):
-        str(line)
-
-
-@pytest.mark.fast
-def test_str_none_case_raises_value_error() -> None:
-    """Test that __str__ raises ValueError for None case value."""
-    # Create a TimeRecorder and manually set None case
-    line = tr.TimeRecorder(
-        {
-            "date": "24.04.2025",
-            "start_time": "08:00",
-            "end_time": "16:00",
-            "end_now": False,
-            "lunch_break_duration": 60,
-            "timezone": "Europe/Berlin",
-            "full_format": "%d.%m.%Y %H:%M:%S",
-            "standard_work_hours": 8,
-        },
-    )
-
-    # Manually set None case
-    line.case = "None"
-
-    with pytest.raises(ValueError, match="Unexpected value for case: None"):
+    assert f"⏰ End time: {end_time}" in result
+    assert f"🍽️  Lunch break: {lunch_break_duration}m" in result
+    assert f"⏱️  Work duration: {work_duration}" in result
+    status_line = _STATUS_RE.search(result)
+    assert status_line is not None
+    assert status_line.group("case", "delta") == status
+
+
+@pytest.mark.parametrize(
+    ("bad_case", "match"),
+    [
+        pytest.param("invalid_case", r"Unexpected value for case: invalid_case", id="invalid"),
+        pytest.param("", r"Unexpected value for case: . Expected 'overtime' or 'undertime'.", id="empty"),
+        pytest.param("None", r"Unexpected value for case: None", id="none"),
+    ],
+)
+def test_str_invalid_case_raises_value_error(time_recorder_factory: Callable[..., tr.TimeRecorder], bad_case: str, match: str) -> None:
+    """Test that __str__ raises ValueError for case values other than overtime and undertime."""
+    # Manually set an invalid case on a copy of the shared recorder
+    line = copy(time_recorder_factory(end_time="16:00", lunch_break_duration=60))
+    line.case = bad_case
+
+    with pytest.raises(ValueError, match=match):
         str(line)
 
 
-@pytest.mark.fast
-def test_str_format_structure() -> None:
+def test_str_format_structure(time_recorder_factory: Callable[..., tr.TimeRecorder]) -> None:
     """Test that __str__ returns the expected format structure."""
-    line = tr.TimeRecorder(
-        {
-            "date": "24.04.2025",
-            "start_time": "08:00",
-            "end_time": "16:30",
-            "end_now": False,
-            "lunch_break_duration": 60,
-            "timezone": "Europe/Berlin",
-            "full_format": "%d.%m.%Y %H:%M:%S",
-            "standard_work_hours": 8,
-        },
-    )
-
-    result = str(line)
-    lines = result.split("\n")
-
-    # Should have exactly 9 lines (empty, title, separator, date, start, end, lunch, work duration, status, end of workday)
-    assert len(lines) == 10
-
-    # First line should be empty
-    assert not lines[0]
-
-    # Second line should contain title
-    assert "Time Recorder - Work Hours Calculator" in lines[1]
-
-    # Third line should contain separator
-    assert "=====================================" in lines[2]
-
-    # Fourth line should contain date
-    assert "📅 Date:" in lines[3]
-
-    # Fifth line should contain start time
-    assert "⏰ Start time:" in lines[4]
-
-    # Sixth line should contain end time
-    assert "⏰ End time:" in lines[5]
-
-    # Seventh line should contain lunch break
-    assert "🍽️  Lunch break:" in lines[6]
-
-    # Eighth line should contain work duration
-    assert "⏱️  Work duration:" in lines[7]
-
-    # Ninth line should contain status
-    assert "📈 Status:" in lines[8]
-
-
-@pytest.mark.fast
-def test_str_decimal_precision() -> None:
-    """Test that __str__ shows correct decimal precision."""
-    # Create a TimeRecorder with fractional hours
-    line = tr.TimeRecorder(
-        {
-            "date": "24.04.2025",
-            "start_time": "08:00",
-            "end_time": "16:20",  # 8 hours 20 minutes total, 1 hour lunch = 7 hours 20 minutes work
-            "end_now": False,
-            "lunch_break_duration": 60,
-            "timezone": "Europe/Berlin",
-            "full_format": "%d.%m.%Y %H:%M:%S",
-            "standard_work_hours": 8,
-        },
-    )
-
-    result = str(line)
-
-    # Should show 7.33 hours (7 hours 20 minutes = 7.33 hours)
-    assert "⏱️  Work duration: 7h 20m (7.33h)" in result
-    # Should show -0.67 hours undertime
-    assert "📈 Status:" in result
-    assert "undertime" in result
-    assert "0h -40m (-0.67h)" in result
-
-
-@pytest.mark.fast
-def test_str_minimal_work_time() -> None:
-    """Test __str__ method with minimal work time."""
-    # Create a TimeRecorder with minimal work time (1 minute work)
-    line = tr.TimeRecorder(
-        {
-            "date": "24.04.2025",
-            "start_time": "08:00",
-            "end_time": "08:01",  # 1 minute work
-            "end_now": False,
-            "lunch_break_duration": 0,
-            "timezone": "Europe/Berlin",
-            "full_format": "%d.%m.%Y %H:%M:%S",
-            "standard_work_hours": 8,
-        },
-    )
+    line = time_recorder_factory(end_time="16:30", lunch_break_duration=60)
 
     result = str(line)
 
-    assert "⏱️  Work duration: 0h 1m (0.02h)" in result
-    assert "📈 Status:" in result
-    assert "undertime" in result
-    assert "-7h -59m (-7.98h)" in result
+    # Leading blank line, title, separator, date, start, end, lunch, work duration, status, end of workday
+    assert _STRUCTURE_RE.fullmatch(result)
 
 
-@pytest.mark.fast
-def test_str_ansi_color_codes_present() -> None:
+def test_str_ansi_color_codes_present(time_recorder_factory: Callable[..., tr.TimeRecorder]) -> None:
     """Test that __str__ includes ANSI color codes for overtime/undertime."""
     # First test the overtime case
-    line_overtime = tr.TimeRecorder(
-        {
-            "date": "24.04.2025",
-            "start_time": "08:00",
-            "end_time": "17:30",
-            "end_now": False,
-            "lunch_break_duration": 60,
-            "timezone": "Europe/Berlin",
-            "full_format": "%d.%m.%Y %H:%M:%S",
-            "standard_work_hours": 8,
-        },
-    )
+    line_overtime = time_recorder_factory(end_time="17:30", lunch_break_duration=60)
 
     result_overtime = str(line_overtime)
 
@@ -383,18 +109,7 @@ def test_str_ansi_color_codes_present() -> None:
     assert "\x1b[0m" in result_overtime  # Reset color code
 
     # Then test the undertime case
-    line_undertime = tr.TimeRecorder(
-        {
-            "date": "24.04.2025",
-            "start_time": "08:00",
-            "end_time": "16:30",
-            "end_now": False,
-            "lunch_break_duration": 60,
-            "timezone": "Europe/Berlin",
-            "full_format": "%d.%m.%Y %H:%M:%S",
-            "standard_work_hours": 8,
-        },
-    )
+    line_undertime = time_recorder_factory(end_time="16:30", lunch_break_duration=60)
 
     result_undertime = str(line_undertime)
 
@@ -5,6 +5,11 @@ import pytest
 
 import src.time_recorder as tr
 
+pytestmark = pytest.mark.fast
+
+_BERLIN = ZoneInfo("Europe/Berlin")
+_DAY = datetime(2025, 4, 24, tzinfo=_BERLIN)
+
 
 @pytest.mark.parametrize(
     "case",
@@ -19,8 +24,8 @@ import src.time_recorder as tr
             "timezone": "Europe/Berlin",
             "standard_work_hours": 8,
             "expected_date": "24.04.2025",
-            "expected_start": datetime.strptime("24.04.2025 07:32:00", "%d.%m.%Y %H:%M:%S").replace(tzinfo=ZoneInfo("Europe/Berlin")),
-            "expected_end": datetime.strptime("24.04.2025 15:40:00", "%d.%m.%Y %H:%M:%S").replace(tzinfo=ZoneInfo("Europe/Berlin")),
+            "expected_start": _DAY.replace(hour=7, minute=32),
+            "expected_end": _DAY.replace(hour=15, minute=40),
             "expected_lunch": timedelta(minutes=60),
         },
         {
@@ -33,13 +38,12 @@ import src.time_recorder as tr
             "timezone": "Europe/Berlin",
             "standard_work_hours": 8,
             "expected_date": "2025-04-24",
-            "expected_start": datetime.strptime("2025-04-24 07:32:00", "%Y-%m-%d %H:%M:%S").replace(tzinfo=ZoneInfo("Europe/Berlin")),
-            "expected_end": datetime.strptime("2025-04-24 15:40:00", "%Y-%m-%d %H:%M:%S").replace(tzinfo=ZoneInfo("Europe/Berlin")),
+            "expected_start": _DAY.replace(hour=7, minute=32),
+            "expected_end": _DAY.replace(hour=15, minute=40),
             "expected_lunch": timedelta(minutes=45),
         },
     ],
 )
-@pytest.mark.fast
 def test_init_valid(case: dict) -> None:
     """Test valid initialization of TimeRecorder with various formats."""
     line = tr.TimeRecorder(
@@ -68,7 +72,6 @@ def test_init_valid(case: dict) -> None:
     assert line.standard_work_hours == case["standard_work_hours"]
 
 
-@pytest.mark.fast
 def test_init_missing_seconds_in_time() -> None:
     """Test that missing seconds in time strings are handled by appending ':00'."""
     # Should append ":00" to time strings missing seconds
@@ -84,11 +87,10 @@ def test_init_missing_seconds_in_time() -> None:
             "standard_work_hours": 8,
         },
     )
-    assert line.start_time == datetime.strptime("24.04.2025 08:00:00", "%d.%m.%Y %H:%M:%S").replace(tzinfo=ZoneInfo("Europe/Berlin"))
-    assert line.end_time == datetime.strptime("24.04.2025 16:00:00", "%d.%m.%Y %H:%M:%S").replace(tzinfo=ZoneInfo("Europe/Berlin"))
+    assert line.start_time == _DAY.replace(hour=8, minute=0)
+    assert line.end_time == _DAY.replace(hour=16, minute=0)
 
 
-@pytest.mark.fast
 def test_init_invalid_time_format_raises() -> None:
     """Test that invalid time format raises a ValueError."""
     with pytest.raises(ValueError, match=r"time data|does not match format|invalid"):
@@ -106,7 +108,6 @@ def test_init_invalid_time_format_raises() -> None:
         )
 
 
-@pytest.mark.fast
 def test_init_start_time_after_end_time_raises() -> None:
     """Test that providing a start time after the end time raises a ValueError."""
     with pytest.raises(ValueError, match=r"The start time must be before the end time."):
@@ -124,7 +125,6 @@ def test_init_start_time_after_end_time_raises() -> None:
         )
 
 
-@pytest.mark.fast
 def test_init_negative_lunch_break_raises() -> None:
     """Test that a negative lunch break duration raises a ValueError."""
     with pytest.raises(ValueError, match=r"The lunch break duration must be a non-negative integer."):
@@ -142,7 +142,6 @@ def test_init_negative_lunch_break_raises() -> None:
         )
 
 
-@pytest.mark.fast
 def test_init_zero_duration_raises() -> None:
     """Test that a zero work duration raises a ValueError."""
     with pytest.raises(ValueError, match=r"The work duration must be positive."):
@@ -160,20 +159,19 @@ def test_init_zero_duration_raises() -> None:
         )
 
 
-@pytest.mark.fast
 def test_init_end_now_sets_end_time_to_current_plus_one_minute() -> None:
     r"""Test that when end_now is True, end_time is set to current time + 1 minute (line 173 in src\time_recorder.py)."""
     # Record time before creating TimeRecorder
     timezone = "Europe/Berlin"
     config_date = "24.04.2025"
-    before_time = datetime.now(tz=ZoneInfo(timezone))
+    before_time = datetime.now(tz=_BERLIN)
 
     # Create TimeRecorder with end_now=True
     # Note: end_time is provided but will be overwritten by line 173
     line = tr.TimeRecorder(
         {
             "date": config_date,
-            "start_time": "08:00",
+            "start_time": "00:00",  # Keeps start before the current time whenever the test runs
             "end_time": "16:00",  # This will be overwritten by line 173
             "end_now": True,  # This triggers line 173
             "lunch_break_duration": 0,
@@ -191,16 +189,15 @@ def test_init_end_now_sets_end_time_to_current_plus_one_minute() -> None:
     # Verify end_time uses the config date (not current date)
     assert line.end_time.date() == expected_date
     # Verify timezone is correct
-    assert line.end_time.tzinfo == ZoneInfo(timezone)
+    assert line.end_time.tzinfo == _BERLIN
     # Verify end_time is after start_time
     assert line.end_time > line.start_time
 
     # Verify the time component is approximately current time + 1 minute
-    # Calculate time difference in seconds (ignoring date)
+    # Calculate time difference in seconds (ignoring date); the modulo absorbs a wrap around midnight
     current_time_seconds = before_time.hour * 3600 + before_time.minute * 60 + before_time.second
     end_time_seconds = line.end_time.hour * 3600 + line.end_time.minute * 60 + line.end_time.second
-    time_diff = end_time_seconds - current_time_seconds
+    time_diff = (end_time_seconds - current_time_seconds) % 86400
 
     # Allow tolerance of 2 seconds for execution time
-    # Time diff should be approximately 60 seconds (1 minute), but account for wrapping
-    assert 58 <= time_diff <= 62 or time_diff >= 86398  # 60 ± 2 seconds, or wrapped around midnight
+    assert 58 <= time_diff <= 62  # 60 ± 2 seconds
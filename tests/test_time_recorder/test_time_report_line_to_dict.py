@@ -1,26 +1,19 @@
 """Unit tests for the time_recording module, including TimeRecorder and related functionality."""
 
+from collections.abc import Callable
+
 import pytest
 
 import src.time_recorder as tr
 
+pytestmark = pytest.mark.fast
+
 
 @pytest.mark.parametrize(
-    ("line", "expected_result"),
+    ("config", "expected_result"),
     [
-        (
-            tr.TimeRecorder(
-                {
-                    "date": "24.02.2025",
-                    "start_time": "08:00",
-                    "end_time": "18:00",
-                    "end_now": False,
-                    "lunch_break_duration": 30,
-                    "timezone": "Europe/Berlin",
-                    "full_format": "%d.%m.%Y %H:%M:%S",
-                    "standard_work_hours": 8,
-                },
-            ),
+        pytest.param(
+            {"date": "24.02.2025", "start_time": "08:00", "end_time": "18:00", "lunch_break_duration": 30},
             {
                 "weekday": "Mon",  # 24.02.2025 is a Monday
                 "date": "24.02.2025",
@@ -29,20 +22,10 @@ import src.time_recorder as tr
                 "lunch_break_duration": 30,
                 "timezone": "Europe/Berlin",
             },
+            id="mon_feb",
         ),
-        (
-            tr.TimeRecorder(
-                {
-                    "date": "24.04.2025",
-                    "start_time": "08:00",
-                    "end_time": "16:00",
-                    "end_now": False,
-                    "lunch_break_duration": 30,
-                    "timezone": "Europe/Berlin",
-                    "full_format": "%d.%m.%Y %H:%M:%S",
-                    "standard_work_hours": 8,
-                },
-            ),
+        pytest.param(
+            {"date": "24.04.2025", "start_time": "08:00", "end_time": "16:00", "lunch_break_duration": 30},
             {
                 "weekday": "Thu",  # 24.04.2025 is a Thursday
                 "date": "24.04.2025",
@@ -51,20 +34,10 @@ import src.time_recorder as tr
                 "lunch_break_duration": 30,
                 "timezone": "Europe/Berlin",
             },
+            id="thu_apr",
         ),
-        (
-            tr.TimeRecorder(
-                {
-                    "date": "29.07.2025",
-                    "start_time": "07:00",
-                    "end_time": "17:20",
-                    "end_now": False,
-                    "lunch_break_duration": 60,
-                    "timezone": "Europe/Berlin",
-                    "full_format": "%d.%m.%Y %H:%M:%S",
-                    "standard_work_hours": 8,
-                },
-            ),
+        pytest.param(
+            {"date": "29.07.2025", "start_time": "07:00", "end_time": "17:20", "lunch_break_duration": 60},
             {
                 "weekday": "Tue",
                 "date": "29.07.2025",
@@ -73,12 +46,17 @@ import src.time_recorder as tr
                 "lunch_break_duration": 60,
                 "timezone": "Europe/Berlin",
             },
+            id="tue_jul",
         ),
     ],
 )
-@pytest.mark.fast
-def test_time_report_line_to_dict_returns_expected_dict(line: tr.TimeRecorder, expected_result: dict) -> None:
+def test_time_report_line_to_dict_returns_expected_dict(
+    time_recorder_factory: Callable[..., tr.TimeRecorder],
+    config: dict,
+    expected_result: dict,
+) -> None:
     """Test that time_report_line_to_dict returns a dictionary with expected keys and values."""
+    line = time_recorder_factory(**config)
     result = line.time_report_line_to_dict()
     assert isinstance(result, dict)
     assert set(result.keys()) == {
@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 from zoneinfo import ZoneInfo
 
 import psutil
@@ -7,25 +7,35 @@ import pytest
 
 import src.time_recorder as tr
 
+# Fake boot time and the values derived from it, computed once for the module
+_BOOT_DT = datetime(2025, 4, 25, 6, 30, 0, tzinfo=ZoneInfo("Europe/Berlin"))
+_BOOT_TS = _BOOT_DT.timestamp()
+_BOOT_DATE = _BOOT_DT.date()
+_BOOT_WEEKDAY = "Fri"  # 25.04.2025 is a Friday
+
+
+@pytest.fixture
+def boot_time(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Fixture to replace psutil.boot_time with a mock returning the fake boot timestamp."""
+    mock_boot_time = Mock(return_value=_BOOT_TS)
+    monkeypatch.setattr(psutil, "boot_time", mock_boot_time)
+    return mock_boot_time
 
-@pytest.mark.fast
-@patch("psutil.boot_time")
-def test_update_boot_time_sets_start_time_to_boot_time(
-    mock_boot_time: Mock,
-    line: tr.TimeRecorder,
-    fake_boot_timestamp: float,
-) -> None:
-    """Test that update_boot_time sets start_time to the system boot time."""
-    mock_boot_time.return_value = fake_boot_timestamp
 
+@pytest.mark.fast
+def test_update_boot_time_end_state(boot_time: Mock, line: tr.TimeRecorder) -> None:
+    """Test that update_boot_time moves start time, date and weekday to the boot time and keeps the end time of day."""
     old_end_time = line.end_time
 
     line.update_boot_time()
 
-    assert line.start_time == datetime.fromtimestamp(fake_boot_timestamp, tz=ZoneInfo(line.timezone))
+    boot_time.assert_called_once_with()
+    assert line.start_time == _BOOT_DT
     # End time should have the same date as boot time, but same time as before
-    assert line.end_time.date() == datetime.fromtimestamp(fake_boot_timestamp).date()
+    assert line.end_time.date() == _BOOT_DATE
     assert line.end_time.time() == old_end_time.time()
+    # The weekday should match the boot date's weekday
+    assert line.weekday == _BOOT_WEEKDAY
     # Work hours and overtime should be recalculated
     assert isinstance(line.work_time, timedelta)
     assert line.case in {"overtime", "undertime"}
@@ -33,27 +43,10 @@ def test_update_boot_time_sets_start_time_to_boot_time(
 
 
 @pytest.mark.fast
-@patch("psutil.boot_time")
-def test_update_boot_time_updates_weekday_and_date(mock_boot_time: Mock, line: tr.TimeRecorder, fake_boot_timestamp: float) -> None:
-    """Test that update_boot_time updates weekday and date to match the boot time."""
-    mock_boot_time.return_value = fake_boot_timestamp
-
-    line.update_boot_time()
-
-    # The start_time and end_time date should match the boot date
-    assert line.start_time.date() == datetime.fromtimestamp(fake_boot_timestamp).date()
-    assert line.end_time.date() == datetime.fromtimestamp(fake_boot_timestamp).date()
-    # The weekday should match the boot date's weekday
-    expected_weekday = datetime.fromtimestamp(fake_boot_timestamp).strftime("%a")
-    assert line.weekday == expected_weekday
-
-
-@pytest.mark.fast
-@patch("psutil.boot_time")
-def test_update_boot_time_psutil_error_handling(mock_boot_time: Mock, line: tr.TimeRecorder) -> None:
+def test_update_boot_time_psutil_error_handling(boot_time: Mock, line: tr.TimeRecorder) -> None:
     """Test that update_boot_time raises BootTimeError when psutil.boot_time fails."""
     # Mock psutil.boot_time to raise a psutil.Error
-    mock_boot_time.side_effect = psutil.Error("Access denied")
+    boot_time.side_effect = psutil.Error("Access denied")
 
     # Should raise BootTimeError with appropriate error message
     with pytest.raises(tr.BootTimeError, match="Error accessing system information"):
@@ -61,11 +54,10 @@ def test_update_boot_time_psutil_error_handling(mock_boot_time: Mock, line: tr.T
 
 
 @pytest.mark.fast
-@patch("psutil.boot_time")
-def test_update_boot_time_value_error_handling(mock_boot_time: Mock, line: tr.TimeRecorder) -> None:
+def test_update_boot_time_value_error_handling(boot_time: Mock, line: tr.TimeRecorder) -> None:
     """Test that update_boot_time raises BootTimeError when datetime parsing fails."""
     # Mock psutil.boot_time to return a valid timestamp
-    mock_boot_time.return_value = datetime(2025, 4, 24, 6, 30, 0, tzinfo=ZoneInfo("Europe/Berlin")).timestamp()
+    boot_time.return_value = datetime(2025, 4, 24, 6, 30, 0, tzinfo=ZoneInfo("Europe/Berlin")).timestamp()
 
     # Modify the line's date_format to be incompatible with the date string
     # This will cause a ValueError when update_boot_time tries to parse the date
@@ -6,6 +6,8 @@ import pytest
 
 import src.visualizer as viz
 
+_HEX_RE = re.compile(r"^#[0-9A-Fa-f]{6}$")
+
 
 @pytest.mark.fast
 def test_color_schemes_work_defined() -> None:
@@ -26,88 +28,29 @@ def test_color_schemes_work_keys() -> None:
 
 @pytest.mark.fast
 def test_color_schemes_work_structure() -> None:
-    """Test that COLOR_SCHEMES_WORK has correct structure for each scheme."""
+    """Test that each scheme in COLOR_SCHEMES_WORK is a list of six valid hex colors."""
     for scheme_name, colors in viz.COLOR_SCHEMES_WORK.items():
         assert isinstance(colors, list), f"Colors for {scheme_name} should be a list"
         assert len(colors) == 6, f"Color scheme {scheme_name} should have 6 colors"
-
-        for color in colors:
-            assert isinstance(color, str), f"Color in {scheme_name} should be a string"
-            assert color.startswith("#"), f"Color {color} in {scheme_name} should be hex format"
-            assert len(color) == 7, f"Color {color} in {scheme_name} should be 7 characters"
-
-
-@pytest.mark.fast
-def test_color_schemes_work_hex_format() -> None:
-    """Test that all colors in COLOR_SCHEMES_WORK are valid hex colors."""
-    hex_pattern = re.compile(r"^#[0-9A-Fa-f]{6}$")
-
-    for scheme_name, colors in viz.COLOR_SCHEMES_WORK.items():
-        for color in colors:
-            assert hex_pattern.match(color), f"Invalid hex color {color} in {scheme_name}"
-
-
-@pytest.mark.fast
-def test_ocean_color_scheme_work() -> None:
-    """Test specific ocean color scheme for work colors."""
-    ocean_colors = viz.COLOR_SCHEMES_WORK["ocean"]
-
-    assert len(ocean_colors) == 6
-    assert all(color.startswith("#") for color in ocean_colors)
-
-    # Check that colors are in expected blue range
-    # Ocean colors should be blue tones
-    expected_colors = ["#1E3A8A", "#1E40AF", "#2563EB", "#3B82F6", "#60A5FA", "#93C5FD"]
-    assert ocean_colors == expected_colors
-
-
-@pytest.mark.fast
-def test_forest_color_scheme_work() -> None:
-    """Test specific forest color scheme for work colors."""
-    forest_colors = viz.COLOR_SCHEMES_WORK["forest"]
-
-    assert len(forest_colors) == 6
-    assert all(color.startswith("#") for color in forest_colors)
-
-    # Check that colors are in expected green range
-    expected_colors = ["#14532D", "#166534", "#15803D", "#16A34A", "#22C55E", "#4ADE80"]
-    assert forest_colors == expected_colors
-
-
-@pytest.mark.fast
-def test_sunset_color_scheme_work() -> None:
-    """Test specific sunset color scheme for work colors."""
-    sunset_colors = viz.COLOR_SCHEMES_WORK["sunset"]
-
-    assert len(sunset_colors) == 6
-    assert all(color.startswith("#") for color in sunset_colors)
-
-    # Check that colors are in expected orange range
-    expected_colors = ["#9A3412", "#A03E0C", "#C2410C", "#EA580C", "#F97316", "#FB923C"]
-    assert sunset_colors == expected_colors
-
-
-@pytest.mark.fast
-def test_lavender_color_scheme_work() -> None:
-    """Test specific lavender color scheme for work colors."""
-    lavender_colors = viz.COLOR_SCHEMES_WORK["lavender"]
-
-    assert len(lavender_colors) == 6
-    assert all(color.startswith("#") for color in lavender_colors)
-
-    # Check that colors are in expected purple range
-    expected_colors = ["#581C87", "#5B21B6", "#6B21A8", "#7C3AED", "#A855F7", "#C084FC"]
-    assert lavender_colors == expected_colors
-
-
-@pytest.mark.fast
-def test_coral_color_scheme_work() -> None:
-    """Test specific coral color scheme for work colors."""
-    coral_colors = viz.COLOR_SCHEMES_WORK["coral"]
-
-    assert len(coral_colors) == 6
-    assert all(color.startswith("#") for color in coral_colors)
-
-    # Check that colors are in expected pink/red range
-    expected_colors = ["#BE185D", "#BE123C", "#DC2626", "#EC4899", "#F472B6", "#F9A8D4"]
-    assert coral_colors == expected_colors
+        assert all(isinstance(color, str) and _HEX_RE.match(color) for color in colors), f"Invalid hex color in {scheme_name}: {colors}"
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize(
+    ("scheme", "expected_colors"),
+    [
+        # Blue tones
+        pytest.param("ocean", ["#1E3A8A", "#1E40AF", "#2563EB", "#3B82F6", "#60A5FA", "#93C5FD"], id="ocean"),
+        # Green tones
+        pytest.param("forest", ["#14532D", "#166534", "#15803D", "#16A34A", "#22C55E", "#4ADE80"], id="forest"),
+        # Orange tones
+        pytest.param("sunset", ["#9A3412", "#A03E0C", "#C2410C", "#EA580C", "#F97316", "#FB923C"], id="sunset"),
+        # Purple tones
+        pytest.param("lavender", ["#581C87", "#5B21B6", "#6B21A8", "#7C3AED", "#A855F7", "#C084FC"], id="lavender"),
+        # Pink/red tones
+        pytest.param("coral", ["#BE185D", "#BE123C", "#DC2626", "#EC4899", "#F472B6", "#F9A8D4"], id="coral"),
+    ],
+)
+def test_color_scheme_work(scheme: str, expected_colors: list[str]) -> None:
+    """Test the exact work colors of each named color scheme."""
+    assert viz.COLOR_SCHEMES_WORK[scheme] == expected_colors
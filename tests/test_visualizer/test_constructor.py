@@ -7,6 +7,20 @@ import src.config_utils as cu
 import src.visualizer as viz
 
 
+@pytest.fixture(scope="module")
+def single_row_df() -> pd.DataFrame:
+    """Fixture to provide a one-day logbook shared by the module; Visualizer copies it, so tests never modify it."""
+    return pd.DataFrame(
+        {
+            "weekday": ["Mon"],
+            "date": ["01.01.2024"],
+            "start_time": ["08:00:00"],
+            "work_time": [8.0],
+            "overtime": [0.0],
+        },
+    )
+
+
 @pytest.mark.fast
 def test_constructor_basic_initialization(sample_config: dict) -> None:
     """Test basic Visualizer initialization with minimal data."""
@@ -38,48 +52,24 @@ def test_constructor_basic_initialization(sample_config: dict) -> None:
 
 
 @pytest.mark.fast
-def test_constructor_all_color_schemes(sample_config: dict) -> None:
+@pytest.mark.parametrize("scheme", list(viz.COLOR_SCHEMES_WORK))
+def test_constructor_all_color_schemes(sample_config: dict, single_row_df: pd.DataFrame, scheme: str) -> None:
     """Test Visualizer initialization with all available color schemes."""
-    df = pd.DataFrame(
-        {
-            "weekday": ["Mon"],
-            "date": ["01.01.2024"],
-            "start_time": ["08:00:00"],
-            "work_time": [8.0],
-            "overtime": [0.0],
-        },
-    )
-
-    color_schemes = ["ocean", "forest", "sunset", "lavender", "coral"]
-
-    for scheme in color_schemes:
-        visualization_config = cu.get_visualization_config(sample_config)
-        visualization_config["color_scheme"] = scheme
-        visualization_config["num_months"] = 6
+    visualization_config = cu.get_visualization_config(sample_config)
+    visualization_config["color_scheme"] = scheme
+    visualization_config["num_months"] = 6
 
-        visualizer = viz.Visualizer(df, visualization_config)
-        assert visualizer.work_colors == viz.COLOR_SCHEMES_WORK[scheme]
+    visualizer = viz.Visualizer(single_row_df, visualization_config)
+    assert visualizer.work_colors == viz.COLOR_SCHEMES_WORK[scheme]
 
 
 @pytest.mark.fast
-def test_constructor_data_filtering(sample_config: dict) -> None:
+def test_constructor_data_filtering(sample_config: dict, year_2024_df: pd.DataFrame) -> None:
     """Test that constructor filters data to last num_months."""
-    # Create DataFrame with dates spanning multiple months
-    dates = pd.date_range(start="2024-01-01", end="2024-12-31", freq="D")
-    df = pd.DataFrame(
-        {
-            "weekday": [d.weekday for d in dates],
-            "date": [d.strftime("%d.%m.%Y") for d in dates],
-            "start_time": ["08:00:00"] * len(dates),
-            "work_time": [8.0] * len(dates),
-            "overtime": [0.0] * len(dates),
-        },
-    )
-
     visualization_config = cu.get_visualization_config(sample_config)
     visualization_config["num_months"] = 3
 
-    visualizer = viz.Visualizer(df, visualization_config)
+    visualizer = viz.Visualizer(year_2024_df, visualization_config)
 
     # Should filter to last 3 months
     expected_start_date = pd.Timestamp("2024-10-01")
@@ -110,46 +100,26 @@ def test_constructor_format_parsing(sample_config: dict) -> None:
 
 
 @pytest.mark.fast
-def test_constructor_work_days_custom(sample_config: dict) -> None:
+def test_constructor_work_days_custom(sample_config: dict, single_row_df: pd.DataFrame) -> None:
     """Test constructor with custom work days."""
-    df = pd.DataFrame(
-        {
-            "weekday": ["Mon"],
-            "date": ["01.01.2024"],
-            "start_time": ["08:00:00"],
-            "work_time": [8.0],
-            "overtime": [0.0],
-        },
-    )
-
     custom_work_days = [1, 2, 3, 4, 5]  # Tuesday to Saturday
 
     visualization_config = cu.get_visualization_config(sample_config)
     visualization_config["num_months"] = 12
     visualization_config["work_days"] = custom_work_days
 
-    visualizer = viz.Visualizer(df, visualization_config)
+    visualizer = viz.Visualizer(single_row_df, visualization_config)
 
     assert visualizer.work_days == custom_work_days
 
 
 @pytest.mark.fast
-def test_constructor_standard_work_hours_float(sample_config: dict) -> None:
+def test_constructor_standard_work_hours_float(sample_config: dict, single_row_df: pd.DataFrame) -> None:
     """Test constructor with float standard work hours."""
-    df = pd.DataFrame(
-        {
-            "weekday": ["Mon"],
-            "date": ["01.01.2024"],
-            "start_time": ["08:00:00"],
-            "work_time": [8.0],
-            "overtime": [0.0],
-        },
-    )
-
     visualization_config = cu.get_visualization_config(sample_config)
     visualization_config["num_months"] = 12
     visualization_config["standard_work_hours"] = 7.5
 
-    visualizer = viz.Visualizer(df, visualization_config)
+    visualizer = viz.Visualizer(single_row_df, visualization_config)
 
     assert visualizer.standard_work_hours == 7.5
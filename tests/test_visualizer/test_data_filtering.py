@@ -14,11 +14,11 @@ def test_constructor_data_filtering_exact_months(sample_config: dict) -> None:
     dates = pd.date_range(start="2024-01-01", end="2024-03-31", freq="D")
     df = pd.DataFrame(
         {
-            "weekday": [d.weekday for d in dates],
-            "date": [d.strftime("%d.%m.%Y") for d in dates],
-            "start_time": ["08:00:00"] * len(dates),
-            "work_time": [8.0] * len(dates),
-            "overtime": [0.0] * len(dates),
+            "weekday": dates.strftime("%a"),
+            "date": dates.strftime("%d.%m.%Y"),
+            "start_time": "08:00:00",
+            "work_time": 8.0,
+            "overtime": 0.0,
         },
     )
 
@@ -38,11 +38,11 @@ def test_constructor_data_filtering_more_than_num_months(sample_config: dict) ->
     dates = pd.date_range(start="2024-01-01", end="2024-06-30", freq="D")
     df = pd.DataFrame(
         {
-            "weekday": [d.weekday for d in dates],
-            "date": [d.strftime("%d.%m.%Y") for d in dates],
-            "start_time": ["08:00:00"] * len(dates),
-            "work_time": [8.0] * len(dates),
-            "overtime": [0.0] * len(dates),
+            "weekday": dates.strftime("%a"),
+            "date": dates.strftime("%d.%m.%Y"),
+            "start_time": "08:00:00",
+            "work_time": 8.0,
+            "overtime": 0.0,
         },
     )
 
@@ -67,11 +67,11 @@ def test_constructor_data_filtering_less_than_num_months(sample_config: dict) ->
     dates = pd.date_range(start="2024-01-01", end="2024-01-31", freq="D")
     df = pd.DataFrame(
         {
-            "weekday": [d.weekday for d in dates],
-            "date": [d.strftime("%d.%m.%Y") for d in dates],
-            "start_time": ["08:00:00"] * len(dates),
-            "work_time": [8.0] * len(dates),
-            "overtime": [0.0] * len(dates),
+            "weekday": dates.strftime("%a"),
+            "date": dates.strftime("%d.%m.%Y"),
+            "start_time": "08:00:00",
+            "work_time": 8.0,
+            "overtime": 0.0,
         },
     )
 
@@ -85,23 +85,12 @@ def test_constructor_data_filtering_less_than_num_months(sample_config: dict) ->
 
 
 @pytest.mark.fast
-def test_constructor_data_filtering_zero_months(sample_config: dict) -> None:
+def test_constructor_data_filtering_zero_months(sample_config: dict, year_2024_df: pd.DataFrame) -> None:
     """Test data filtering with zero num_months."""
-    dates = pd.date_range(start="2024-01-01", end="2024-12-31", freq="D")
-    df = pd.DataFrame(
-        {
-            "weekday": [d.weekday for d in dates],
-            "date": [d.strftime("%d.%m.%Y") for d in dates],
-            "start_time": ["08:00:00"] * len(dates),
-            "work_time": [8.0] * len(dates),
-            "overtime": [0.0] * len(dates),
-        },
-    )
-
     visualization_config = cu.get_visualization_config(sample_config)
     visualization_config["num_months"] = 0  # Zero months
 
-    visualizer = viz.Visualizer(df, visualization_config)
+    visualizer = viz.Visualizer(year_2024_df, visualization_config)
 
     # When num_months is 0, the filtering results in empty DataFrame
     # because max_date - 0 months = max_date, so no dates are > max_date
@@ -109,23 +98,12 @@ def test_constructor_data_filtering_zero_months(sample_config: dict) -> None:
 
 
 @pytest.mark.fast
-def test_constructor_data_filtering_negative_months(sample_config: dict) -> None:
+def test_constructor_data_filtering_negative_months(sample_config: dict, year_2024_df: pd.DataFrame) -> None:
     """Test data filtering with negative num_months."""
-    dates = pd.date_range(start="2024-01-01", end="2024-12-31", freq="D")
-    df = pd.DataFrame(
-        {
-            "weekday": [d.weekday for d in dates],
-            "date": [d.strftime("%d.%m.%Y") for d in dates],
-            "start_time": ["08:00:00"] * len(dates),
-            "work_time": [8.0] * len(dates),
-            "overtime": [0.0] * len(dates),
-        },
-    )
-
     visualization_config = cu.get_visualization_config(sample_config)
     visualization_config["num_months"] = -1  # Negative months
 
-    visualizer = viz.Visualizer(df, visualization_config)
+    visualizer = viz.Visualizer(year_2024_df, visualization_config)
 
     # When num_months is negative, the filtering results in empty DataFrame
     # because max_date - (-1) months = max_date + 1 month, so no dates are > max_date + 1 month
@@ -192,9 +170,9 @@ def test_constructor_data_filtering_irregular_dates(sample_config: dict) -> None
         {
             "weekday": weekdays,
             "date": dates,
-            "start_time": ["08:00:00"] * len(dates),
-            "work_time": [8.0] * len(dates),
-            "overtime": [0.0] * len(dates),
+            "start_time": "08:00:00",
+            "work_time": 8.0,
+            "overtime": 0.0,
         },
     )
 
@@ -215,11 +193,11 @@ def test_constructor_data_filtering_leap_year(sample_config: dict) -> None:
     dates = pd.date_range(start="2024-02-01", end="2024-02-29", freq="D")
     df = pd.DataFrame(
         {
-            "weekday": [d.weekday for d in dates],
-            "date": [d.strftime("%d.%m.%Y") for d in dates],
-            "start_time": ["08:00:00"] * len(dates),
-            "work_time": [8.0] * len(dates),
-            "overtime": [0.0] * len(dates),
+            "weekday": dates.strftime("%a"),
+            "date": dates.strftime("%d.%m.%Y"),
+            "start_time": "08:00:00",
+            "work_time": 8.0,
+            "overtime": 0.0,
         },
     )
 
@@ -239,11 +217,11 @@ def test_constructor_data_filtering_year_boundary(sample_config: dict) -> None:
     dates = pd.date_range(start="2023-12-01", end="2024-02-29", freq="D")
     df = pd.DataFrame(
         {
-            "weekday": [d.weekday for d in dates],
-            "date": [d.strftime("%d.%m.%Y") for d in dates],
-            "start_time": ["08:00:00"] * len(dates),
-            "work_time": [8.0] * len(dates),
-            "overtime": [0.0] * len(dates),
+            "weekday": dates.strftime("%a"),
+            "date": dates.strftime("%d.%m.%Y"),
+            "start_time": "08:00:00",
+            "work_time": 8.0,
+            "overtime": 0.0,
         },
     )
 
@@ -261,27 +239,15 @@ def test_constructor_data_filtering_year_boundary(sample_config: dict) -> None:
 
 
 @pytest.mark.fast
-def test_constructor_data_filtering_very_large_num_months(sample_config: dict) -> None:
+def test_constructor_data_filtering_very_large_num_months(sample_config: dict, year_2024_df: pd.DataFrame) -> None:
     """Test data filtering with very large num_months."""
-    # Create data for 1 year
-    dates = pd.date_range(start="2024-01-01", end="2024-12-31", freq="D")
-    df = pd.DataFrame(
-        {
-            "weekday": [d.weekday for d in dates],
-            "date": [d.strftime("%d.%m.%Y") for d in dates],
-            "start_time": ["08:00:00"] * len(dates),
-            "work_time": [8.0] * len(dates),
-            "overtime": [0.0] * len(dates),
-        },
-    )
-
     visualization_config = cu.get_visualization_config(sample_config)
     visualization_config["num_months"] = 1000  # Very large number
 
-    visualizer = viz.Visualizer(df, visualization_config)
+    visualizer = viz.Visualizer(year_2024_df, visualization_config)
 
     # Should include all data when num_months is very large
-    assert len(visualizer.df) == len(df)
+    assert len(visualizer.df) == len(year_2024_df)
 
 
 @pytest.mark.fast
@@ -291,11 +257,11 @@ def test_constructor_data_filtering_float_num_months(sample_config: dict) -> Non
     dates = pd.date_range(start="2024-01-01", end="2024-03-31", freq="D")
     df = pd.DataFrame(
         {
-            "weekday": [d.weekday for d in dates],
-            "date": [d.strftime("%d.%m.%Y") for d in dates],
-            "start_time": ["08:00:00"] * len(dates),
-            "work_time": [8.0] * len(dates),
-            "overtime": [0.0] * len(dates),
+            "weekday": dates.strftime("%a"),
+            "date": dates.strftime("%d.%m.%Y"),
+            "start_time": "08:00:00",
+            "work_time": 8.0,
+            "overtime": 0.0,
         },
     )
 